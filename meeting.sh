@@ -106,6 +106,8 @@ show_help() {
     echo ""
     echo "Options:"
     echo "  --video FILE              Path to video file"
+    echo "  --batch PATH...           Process several videos (files or directories) in parallel"
+    echo "  --max-workers N           Maximum number of parallel workers in batch mode"
     echo "  --prompt TEMPLATE         Prompt template (prompt.txt, prompt_wo_transcript.txt, prompt_only_transcript.txt, 'only transcript', 'without transcript')"
     echo "  --notes TEXT              Notes content"
     echo "  -d, --directory DIR       Specify target directory (instead of auto-creating timestamp-based directory)"
@@ -120,6 +122,7 @@ show_help() {
     echo "  $0 --video meeting.mp4 --prompt prompt_only_transcript.txt"
     echo "  $0 --video meeting.mp4 --prompt 'only transcript'"
     echo "  $0 --video meeting.mp4 --dry-run --debug"
+    echo "  $0 --batch recordings/ --notes '' --max-workers 2"
     echo "  $0 --setup"
     echo ""
     echo "The script automatically:"
@@ -11,122 +11,644 @@ import os
 import sys
 import json
 import logging
+import logging.handlers
 import argparse
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import io
+import mmap
+import queue
 import subprocess
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, ClassVar, Tuple, Mapping
+from dataclasses import dataclass, field, replace
 import tempfile
 import platform
+import random
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
-# Load environment variables
-try:
-    from dotenv import load_dotenv
+
+def _load_env_file():
+    """Load environment variables from .env unless SKIP_DOTENV=1 (e.g. for batch jobs)."""
+    if os.getenv("SKIP_DOTENV") == "1":
+        return
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
+        return
+    
     load_dotenv()
+
+
+# Import optional dependencies (questionary is imported lazily where it is used,
+# as it pulls in prompt_toolkit and is not needed for non-interactive runs)
+try:
+    import orjson
 except ImportError:
-    print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
-    pass
+    orjson = None
+
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
 
-# Import optional dependencies
 try:
-    import questionary
-    import requests
+    import msgspec
+    from typing import Annotated
 except ImportError:
-    questionary = None
-    requests = None
+    msgspec = None
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+if msgspec is not None:
+    class ParameterDefaults(msgspec.Struct):
+        """Generation parameter defaults, validated against the Gemini API ranges."""
+        temperature: Annotated[float, msgspec.Meta(ge=0.0, le=2.0)] = 0.3
+        top_p: Annotated[float, msgspec.Meta(ge=0.0, le=1.0)] = 0.95
+        top_k: int = 64
+        candidate_count: Annotated[int, msgspec.Meta(ge=1, le=8)] = 1
+    
+    class ModelLimits(msgspec.Struct):
+        """Limits of a single Gemini model as configured in model_limits.json."""
+        max_input_tokens: Annotated[int, msgspec.Meta(gt=0)] = 1048576
+        max_output_tokens: Annotated[int, msgspec.Meta(gt=0)] = 65535
+        max_images_per_prompt: Annotated[int, msgspec.Meta(ge=0)] = 3000
+        max_image_size_mb: Annotated[float, msgspec.Meta(gt=0)] = 7
+        max_audio_length_hours: Annotated[float, msgspec.Meta(gt=0)] = 8.4
+        max_audio_files_per_prompt: Annotated[int, msgspec.Meta(ge=0)] = 1
+        parameter_defaults: ParameterDefaults = msgspec.field(default_factory=ParameterDefaults)
+
+
+def _decode_model_limits(data: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse model limits JSON.
+    
+    With msgspec installed the file is validated against ModelLimits while parsing,
+    so out-of-range values are reported with their exact location and missing
+    entries get their defaults. The result is returned as plain dicts. A file that
+    fails validation is checked again field by field, so one bad value does not
+    discard the rest of the file.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.to_builtins(msgspec.json.decode(data, type=Dict[str, ModelLimits]))
+        except msgspec.ValidationError:
+            return {model_name: _validate_model_limits(model_name, entry)
+                    for model_name, entry in _json_loads(data).items()}
+    return _json_loads(data)
+
+
+def _validate_model_limits(model_name: str, entry: Any) -> Dict[str, Any]:
+    """
+    Validate the limits of one model field by field (msgspec only).
+    
+    Invalid fields are replaced by their defaults. Numeric parameter defaults are
+    kept even when out of range, they are clamped by Config._validate_parameter_defaults.
+    
+    Args:
+        model_name: Model the entry belongs to, for warnings
+        entry: Raw JSON value of the model entry
+    
+    Returns:
+        Complete limits of the model as plain dicts
+    """
+    limits = msgspec.to_builtins(ModelLimits())
+    if not isinstance(entry, dict):
+        print(f"Warning: Invalid model limits for {model_name}, using default limits")
+        return limits
+    
+    for key, value in entry.items():
+        if key not in limits:
+            continue
+        
+        if key == "parameter_defaults" and isinstance(value, dict):
+            for name, param in value.items():
+                if name not in limits[key]:
+                    continue
+                if isinstance(param, (int, float)) and not isinstance(param, bool):
+                    limits[key][name] = param
+                else:
+                    print(f"Warning: Invalid {model_name}.{key}.{name} {param!r} in model limits, using default {limits[key][name]}")
+            continue
+        
+        try:
+            limits[key] = msgspec.to_builtins(msgspec.convert({key: value}, type=ModelLimits))[key]
+        except msgspec.ValidationError as e:
+            print(f"Warning: Invalid {model_name}.{key} in model limits ({e}), using default {limits[key]}")
+    
+    return limits
+
+
+# Directory containing this script and its templates/presets
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# Default model limits if the model limits file is not found or invalid
+DEFAULT_MODEL_LIMITS: Dict[str, Dict[str, Any]] = {
+    "gemini-2.5-pro": {
+        "max_input_tokens": 1048576,
+        "max_output_tokens": 65535,
+        "max_images_per_prompt": 3000,
+        "max_image_size_mb": 7,
+        "max_audio_length_hours": 8.4,
+        "max_audio_files_per_prompt": 1,
+        "parameter_defaults": {
+            "temperature": 0.3,
+            "top_p": 0.95,
+            "top_k": 64,
+            "candidate_count": 1
+        }
+    },
+    "gemini-2.5-flash": {
+        "max_input_tokens": 1048576,
+        "max_output_tokens": 65535,
+        "max_images_per_prompt": 3000,
+        "max_image_size_mb": 7,
+        "max_audio_length_hours": 8.4,
+        "max_audio_files_per_prompt": 1,
+        "parameter_defaults": {
+            "temperature": 0.3,
+            "top_p": 0.95,
+            "top_k": 64,
+            "candidate_count": 1
+        }
+    },
+    "gemini-2.0-flash": {
+        "max_input_tokens": 1048576,
+        "max_output_tokens": 8192,
+        "max_images_per_prompt": 3000,
+        "max_image_size_mb": 7,
+        "max_audio_length_hours": 8.4,
+        "max_audio_files_per_prompt": 1,
+        "parameter_defaults": {
+            "temperature": 0.3,
+            "top_p": 0.95,
+            "top_k": 64,
+            "candidate_count": 1
+        }
+    }
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model_limits(path_str: str, mtime: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Load model limits from file or return defaults.
+    
+    Cached per path and modification time, so repeated Config instances (e.g. batch
+    workers) parse the file only once while edits to it are still picked up.
+    """
+    if mtime:
+        try:
+            with open(path_str, 'rb') as f:
+                return _decode_model_limits(f.read())
+        except Exception as e:
+            print(f"Warning: Could not load model limits from {Path(path_str).name}: {e}")
+            print("Using default model limits...")
+    
+    return DEFAULT_MODEL_LIMITS
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_template_path(file_name: str) -> Path:
+    """Resolve a template file name relative to the script directory."""
+    return _MODULE_DIR / file_name
+
+
+def _coerce_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer setting, warning and using the default on malformed values."""
+    value = env.get(key)
+    if value is None:
+        return default
+    
+    try:
+        return int(value)
+    except ValueError:
+        print(f"Warning: Invalid integer for {key}: {value!r}, using default {default}")
+        return default
+
+
+def _coerce_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    """Read a boolean setting ("true" enables it, case-insensitive)."""
+    value = env.get(key)
+    if value is None:
+        return default
+    return value.lower() == "true"
+
+
+def _base64_size(size: int) -> int:
+    """Return the length of `size` bytes once base64-encoded, as inline request data is sent."""
+    return 4 * ((size + 2) // 3)
+
+
+def _hash_file(path: str) -> bytes:
+    """Return a 128-bit BLAKE2b digest of a file's content, read through mmap."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest.update(data)
+    return digest.digest()
+
+
+def _fast_rmtree(path: str):
+    """
+    Remove a directory tree using os.scandir.
+    
+    Entry types come from the directory listing itself, so each file is removed
+    with a single unlink instead of an additional lstat per entry.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_liburing():
+    """Import the liburing bindings once, only when io_uring reads are enabled."""
+    import liburing
+    return liburing
+
+
+def _io_uring_available() -> bool:
+    """Check for the liburing bindings and a Linux kernel with io_uring (5.1+)."""
+    if platform.system() != "Linux":
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split(".")[:2])
+    except ValueError:
+        return False
+    if (major, minor) < (5, 1):
+        return False
+    try:
+        _import_liburing()
+    except ImportError:
+        return False
+    return True
+
+
+class IoUringBatchEngine:
+    """
+    Read whole files through io_uring.
+    
+    Read requests from any thread are queued to a daemon thread, which submits
+    everything pending as one batch of reads and completes each request's
+    future from the completion queue. If the ring fails, every pending and
+    later request fails instead of waiting forever.
+    
+    Example:
+        engine = IoUringBatchEngine()
+        data = engine.read("frame_0001.jpg").result()
+        engine.close()
+    """
+    
+    def __init__(self, entries: int = 64):
+        self._liburing = _import_liburing()
+        self._entries = entries
+        self._ring = self._liburing.Ring()
+        self._liburing.io_uring_queue_init(entries, self._ring)
+        self._requests = queue.Queue()
+        self._error = None
+        # Buffers of a batch aborted mid-flight stay referenced until the ring is closed
+        self._abandoned = []
+        self._thread = threading.Thread(target=self._run, name="io_uring", daemon=True)
+        self._thread.start()
+    
+    def read(self, path: str) -> Future:
+        """Queue a file read; the returned future resolves to the file's bytes."""
+        future = Future()
+        self._requests.put((path, future))
+        if self._error is not None:
+            # The reader thread is gone, fail this request (and anything else queued)
+            self._fail_queued()
+        return future
+    
+    def close(self):
+        """Stop the reader thread and release the ring."""
+        self._requests.put(None)
+        self._thread.join()
+        self._liburing.io_uring_queue_exit(self._ring)
+        self._abandoned.clear()
+    
+    def _run(self):
+        try:
+            while True:
+                request = self._requests.get()
+                if request is None:
+                    return
+                
+                # Take everything queued meanwhile into the same submission
+                batch = [request]
+                stop = False
+                while len(batch) < self._entries:
+                    try:
+                        request = self._requests.get_nowait()
+                    except queue.Empty:
+                        break
+                    if request is None:
+                        stop = True
+                        break
+                    batch.append(request)
+                
+                self._read_batch(batch)
+                if stop:
+                    return
+        except Exception as e:
+            self._error = RuntimeError(f"io_uring reader stopped: {e}")
+            self._fail_queued()
+    
+    def _fail_queued(self):
+        """Fail every request still waiting in the queue."""
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None and not request[1].done():
+                request[1].set_exception(self._error)
+    
+    def _read_batch(self, batch: List[Tuple[str, Future]]):
+        liburing = self._liburing
+        pending = {}
+        try:
+            for index, (path, future) in enumerate(batch):
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError as e:
+                    future.set_exception(e)
+                    continue
+                try:
+                    size = os.fstat(fd).st_size
+                except OSError as e:
+                    os.close(fd)
+                    future.set_exception(e)
+                    continue
+                
+                if size == 0:
+                    os.close(fd)
+                    future.set_result(b"")
+                    continue
+                
+                buffer = bytearray(size)
+                pending[index] = (fd, buffer)
+                sqe = liburing.io_uring_get_sqe(self._ring)
+                liburing.io_uring_prep_read(sqe, fd, buffer, 0)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            
+            if not pending:
+                return
+            
+            liburing.io_uring_submit(self._ring)
+            cqe = liburing.Cqe()
+            while pending:
+                # Failed reads raise from wait_cqe or from res, depending on arrival order
+                error = None
+                try:
+                    liburing.io_uring_wait_cqe(self._ring, cqe)
+                except OSError as e:
+                    error = e
+                entry = cqe[0]
+                index = entry.user_data
+                if error is None:
+                    try:
+                        read_size = entry.res
+                    except OSError as e:
+                        error = e
+                liburing.io_uring_cqe_seen(self._ring, entry)
+                
+                path, future = batch[index]
+                fd, buffer = pending.pop(index)
+                try:
+                    if error is not None:
+                        future.set_exception(error)
+                        continue
+                    if read_size < len(buffer):
+                        # Short read: fetch the remainder with a regular read
+                        buffer[read_size:] = os.pread(fd, len(buffer) - read_size, read_size)
+                    future.set_result(bytes(buffer))
+                finally:
+                    os.close(fd)
+        except Exception as e:
+            # The ring is in an unknown state: fail the whole batch and stop the reader
+            for fd, buffer in pending.values():
+                os.close(fd)
+                self._abandoned.append(buffer)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"io_uring read failed: {e}"))
+            raise
+
+
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "meeting-processor"
+
+
+def _read_cache_file(name: str) -> Dict[str, Any]:
+    """Read a JSON cache file from the cache directory (empty if missing or corrupt)."""
+    try:
+        with open(_CACHE_DIR / name, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache_file(name: str, data: Dict[str, Any]):
+    """Write a JSON cache file; failures are ignored as the cache is only an optimization."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # Write and rename so concurrent workers never read a partial file
+        with tempfile.NamedTemporaryFile('wb', dir=_CACHE_DIR, suffix=".tmp", delete=False) as f:
+            f.write(_json_dumps(data))
+        os.replace(f.name, _CACHE_DIR / name)
+    except OSError:
+        pass
+
+
+def _probe_nvenc(ffmpeg_path: str) -> bool:
+    """
+    Check whether an ffmpeg binary can actually encode with h264_nvenc.
+    
+    Builds routinely list h264_nvenc without a usable GPU or driver, so a
+    single frame is encoded as a test. A working encoder is cached in caps.json,
+    keyed by the binary path and its mtime, so other processes and later runs
+    skip the spawn. Failures are not cached, as they are often temporary (all
+    NVENC sessions busy, driver not loaded yet, GPU out of memory).
+    """
+    binary = shutil.which(ffmpeg_path)
+    if binary is None:
+        return False
+    binary = os.path.realpath(binary)
+    mtime = os.stat(binary).st_mtime
+    
+    caps = _read_cache_file("caps.json")
+    entry = caps.get(binary)
+    if entry and entry.get("mtime") == mtime and entry.get("nvenc"):
+        return True
+    
+    try:
+        result = subprocess.run([binary, "-hide_banner", "-loglevel", "error",
+                                 "-f", "lavfi", "-i", "nullsrc=s=256x256",
+                                 "-frames:v", "1", "-c:v", "h264_nvenc", "-f", "null", "-"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    if result.returncode != 0:
+        return False
+    
+    caps[binary] = {"mtime": mtime, "nvenc": True}
+    _write_cache_file("caps.json", caps)
+    
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _import_genai():
+    """
+    Import the Google GenAI SDK once, on first use.
+    
+    The SDK pulls in httpx and pydantic and takes noticeable time to import, so
+    it is not loaded at startup (--help, --setup, prompt selection).
+    
+    Returns:
+        Tuple of the genai and genai.types modules
+    """
+    from google import genai
+    from google.genai import types
+    return genai, types
+
+
+def _try_import(module_name: str, attr: str):
+    """Return module_name.attr, or None if the module or attribute is unavailable."""
+    try:
+        return getattr(importlib.import_module(module_name), attr, None)
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _retryable_types() -> frozenset:
+    """
+    Exception types that always mean 503 UNAVAILABLE.
+    
+    Built on first use (i.e. on the error path) so the Google client libraries
+    are not imported at startup.
+    """
+    return frozenset(filter(None, [
+        _try_import("google.api_core.exceptions", "ServiceUnavailable"),
+    ]))
 
 
 @dataclass
 class Config:
     """Configuration class for the meeting processor."""
-    ffmpeg_path: str = os.getenv("FFMPEG_PATH", "ffmpeg")
-    handbrake_path: str = os.getenv("HANDBRAKE_PATH", "HandBrakeCLI")
-    handbrake_preset_file: str = os.getenv("HANDBRAKE_PRESET_FILE", "Meeting.json")
-    handbrake_preset_name: str = os.getenv("HANDBRAKE_PRESET_NAME", "Meeting")
-    frame_interval: int = int(os.getenv("FRAME_INTERVAL", "60"))
-    default_prompt: str = os.getenv("DEFAULT_PROMPT", "prompt.txt")
-    gemini_model: str = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
-    gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
-    preferred_date_source: str = os.getenv("PREFERRED_DATE_SOURCE", "metadata")
+    ffmpeg_path: str = "ffmpeg"
+    ffprobe_path: str = ""
+    handbrake_path: str = "HandBrakeCLI"
+    handbrake_preset_file: str = "Meeting.json"
+    handbrake_preset_name: str = "Meeting"
+    frame_interval: int = 60
+    default_prompt: str = "prompt.txt"
+    gemini_model: str = "gemini-2.5-pro"
+    gemini_api_key: str = ""
+    preferred_date_source: str = "metadata"
     output_dir: str = ""
     target_directory: str = ""
-    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
-    dry_run: bool = os.getenv("DRY_RUN", "false").lower() == "true"
-    no_cleanup: bool = os.getenv("NO_CLEANUP", "false").lower() == "true"
+    debug: bool = False
+    dry_run: bool = False
+    no_cleanup: bool = False
+    use_handbrake: bool = False
+    nvenc_max_sessions: int = 2
+    nvenc_preset: str = "p1"
+    nvenc_cq: int = 23
+    upload_concurrency: int = 8
+    use_uring: bool = False
+    exclusive_target_dir: bool = False  # Set for batch jobs, never reuse an existing directory
+    interactive: bool = True  # Cleared for batch jobs, which must never prompt
+    model_limits_file: str = "model_limits.json"
     model_limits: Dict[str, Dict[str, Any]] = None
+    _parameter_defaults: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "Config":
+        """Create a configuration from a single snapshot of the environment."""
+        env = dict(env)
+        return cls(
+            ffmpeg_path=env.get("FFMPEG_PATH", cls.ffmpeg_path),
+            ffprobe_path=env.get("FFPROBE_PATH", cls.ffprobe_path),
+            handbrake_path=env.get("HANDBRAKE_PATH", cls.handbrake_path),
+            handbrake_preset_file=env.get("HANDBRAKE_PRESET_FILE", cls.handbrake_preset_file),
+            handbrake_preset_name=env.get("HANDBRAKE_PRESET_NAME", cls.handbrake_preset_name),
+            frame_interval=_coerce_int(env, "FRAME_INTERVAL", cls.frame_interval),
+            default_prompt=env.get("DEFAULT_PROMPT", cls.default_prompt),
+            gemini_model=env.get("GEMINI_MODEL", cls.gemini_model),
+            gemini_api_key=env.get("GEMINI_API_KEY", cls.gemini_api_key),
+            preferred_date_source=env.get("PREFERRED_DATE_SOURCE", cls.preferred_date_source),
+            debug=_coerce_bool(env, "DEBUG", cls.debug),
+            dry_run=_coerce_bool(env, "DRY_RUN", cls.dry_run),
+            no_cleanup=_coerce_bool(env, "NO_CLEANUP", cls.no_cleanup),
+            use_handbrake=_coerce_bool(env, "USE_HANDBRAKE", cls.use_handbrake),
+            nvenc_max_sessions=_coerce_int(env, "NVENC_MAX_SESSIONS", cls.nvenc_max_sessions),
+            nvenc_preset=env.get("NVENC_PRESET", cls.nvenc_preset),
+            nvenc_cq=_coerce_int(env, "NVENC_CQ", cls.nvenc_cq),
+            upload_concurrency=_coerce_int(env, "UPLOAD_CONCURRENCY", cls.upload_concurrency),
+            use_uring=_coerce_bool(env, "USE_URING", cls.use_uring),
+            model_limits_file=env.get("MODEL_LIMITS_FILE", cls.model_limits_file)
+        )
     
     def __post_init__(self):
         """Initialize model limits from file or defaults."""
+        if not self.ffprobe_path:
+            # ffprobe ships next to ffmpeg
+            self.ffprobe_path = os.path.join(os.path.dirname(self.ffmpeg_path), "ffprobe")
+        
         if self.model_limits is None:
-            self.model_limits = self._load_model_limits()
+            model_limits_path = _MODULE_DIR / self.model_limits_file
+            mtime = model_limits_path.stat().st_mtime if model_limits_path.exists() else 0
+            self.model_limits = _load_model_limits(str(model_limits_path), mtime)
     
-    def _load_model_limits(self) -> Dict[str, Dict[str, Any]]:
-        """Load model limits from file or return defaults."""
-        model_limits_file = os.getenv("MODEL_LIMITS_FILE", "model_limits.json")
-        model_limits_path = Path(__file__).parent / model_limits_file
-        
-        if model_limits_path.exists():
-            try:
-                with open(model_limits_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load model limits from {model_limits_file}: {e}")
-                print("Using default model limits...")
-        
-        # Default model limits if file not found or invalid
-        return {
-            "gemini-2.5-pro": {
-                "max_input_tokens": 1048576,
-                "max_output_tokens": 65535,
-                "max_images_per_prompt": 3000,
-                "max_image_size_mb": 7,
-                "max_audio_length_hours": 8.4,
-                "max_audio_files_per_prompt": 1,
-                "parameter_defaults": {
-                    "temperature": 0.3,
-                    "top_p": 0.95,
-                    "top_k": 64,
-                    "candidate_count": 1
-                }
-            },
-            "gemini-2.5-flash": {
-                "max_input_tokens": 1048576,
-                "max_output_tokens": 65535,
-                "max_images_per_prompt": 3000,
-                "max_image_size_mb": 7,
-                "max_audio_length_hours": 8.4,
-                "max_audio_files_per_prompt": 1,
-                "parameter_defaults": {
-                    "temperature": 0.3,
-                    "top_p": 0.95,
-                    "top_k": 64,
-                    "candidate_count": 1
-                }
-            },
-            "gemini-2.0-flash": {
-                "max_input_tokens": 1048576,
-                "max_output_tokens": 8192,
-                "max_images_per_prompt": 3000,
-                "max_image_size_mb": 7,
-                "max_audio_length_hours": 8.4,
-                "max_audio_files_per_prompt": 1,
-                "parameter_defaults": {
-                    "temperature": 0.3,
-                    "top_p": 0.95,
-                    "top_k": 64,
-                    "candidate_count": 1
-                }
-            }
-        }
+    @functools.cached_property
+    def nvenc_usable(self) -> bool:
+        """Whether ffmpeg_path can encode with NVENC (probed once, shared with batch workers)."""
+        return _probe_nvenc(self.ffmpeg_path)
     
     def get_model_limits(self, model_name: str) -> Dict[str, Any]:
         """Get limits for a specific model."""
         return self.model_limits.get(model_name, self.model_limits.get("gemini-2.5-pro", {}))
     
     def get_parameter_defaults(self, model_name: str) -> Dict[str, Any]:
-        """Get parameter defaults for a specific model."""
+        """Get parameter defaults for a specific model (validated once per model)."""
+        if model_name not in self._parameter_defaults:
+            self._parameter_defaults[model_name] = self._validate_parameter_defaults(model_name)
+        return self._parameter_defaults[model_name]
+    
+    def _validate_parameter_defaults(self, model_name: str) -> Dict[str, Any]:
+        """Read parameter defaults for a model and clamp them to their valid ranges."""
         model_limits = self.get_model_limits(model_name)
         defaults = model_limits.get("parameter_defaults", {
             "temperature": 0.3,
@@ -135,7 +657,7 @@ class Config:
             "candidate_count": 1
         })
         
-        # Validate parameter ranges
+        # Validate parameter ranges (already enforced at load time when msgspec accepted the file)
         validated_defaults = {}
         
         # Temperature: 0.0-2.0
@@ -165,6 +687,41 @@ class Config:
 class MeetingProcessor:
     """Main class for processing meeting videos and generating documentation."""
     
+    # Prompt shortcuts and interactive choices (built once, not per call)
+    _SHORTCUTS: ClassVar[Dict[str, str]] = {
+        "only transcript": "prompt_only_transcript.txt",
+        "without transcript": "prompt_wo_transcript.txt"
+    }
+    _PROMPT_CHOICES: ClassVar[Tuple[str, ...]] = (
+        "prompt.txt - Full analysis with transcript and visual content",
+        "prompt_wo_transcript.txt - Analysis without transcript (visual only)",
+        "prompt_only_transcript.txt - Transcript-only analysis (no visual content)",
+        "only transcript - Shortcut for transcript-only",
+        "without transcript - Shortcut for visual-only"
+    )
+    # Request size limit for data sent inline with generate_content, and the part of it
+    # kept free for the JSON envelope, file references and generation config
+    _INLINE_BYTES_LIMIT: ClassVar[int] = 20 * 1024 * 1024
+    _INLINE_HEADROOM: ClassVar[int] = 1024 * 1024
+    # Backoff base in seconds for retrying single file uploads
+    _UPLOAD_RETRY_BASE_DELAY: ClassVar[int] = 5
+    # MIME types for uploads from memory (the SDK cannot derive them without a file name)
+    _UPLOAD_MIME_TYPES: ClassVar[Dict[str, str]] = {
+        "audio": "audio/mp4",
+        "frame": "image/jpeg",
+        "note": "text/plain"
+    }
+    # HandBrake VideoEncoder -> ffmpeg encoder (VideoToolbox only exists on macOS)
+    _FFMPEG_VIDEO_ENCODERS: ClassVar[Dict[str, str]] = {
+        "x264": "libx264",
+        "x264_10bit": "libx264",
+        "x265": "libx265",
+        "x265_10bit": "libx265",
+        "vt_h264": "h264_videotoolbox",
+        "vt_h265": "hevc_videotoolbox",
+        "vt_h265_10bit": "hevc_videotoolbox"
+    }
+    
     def __init__(self, config: Config):
         self.config = config
         self.target_dir = ""
@@ -175,6 +732,12 @@ class MeetingProcessor:
         self.note_path = ""
         self.prompt_path = ""
         self.process_log_path = ""
+        self._gemini_client = None
+        self._audio_upload = None
+        # Background encode started by _process_media, killed if the main thread fails
+        self._media_process = None
+        self._media_cancelled = False
+        self._media_lock = threading.Lock()
         
         # Setup logging
         self._setup_logging()
@@ -187,7 +750,7 @@ class MeetingProcessor:
         handlers = [logging.StreamHandler(sys.stdout)]
         
         # Add file handler only if log path exists and directory is created
-        if self.process_log_path and self.process_log_path.parent.exists():
+        if self.process_log_path and os.path.isdir(os.path.dirname(self.process_log_path)):
             try:
                 handlers.append(logging.FileHandler(self.process_log_path))
             except Exception:
@@ -208,7 +771,7 @@ class MeetingProcessor:
     
     def _update_logging_with_file(self):
         """Update logging to include file handler after target directory is created."""
-        if self.process_log_path and self.process_log_path.parent.exists():
+        if self.process_log_path and os.path.isdir(os.path.dirname(self.process_log_path)):
             try:
                 # Remove existing handlers to avoid duplicates
                 for handler in self.logger.handlers[:]:
@@ -226,6 +789,31 @@ class MeetingProcessor:
             except Exception as e:
                 self.logger.warning(f"Failed to add file logging: {e}")
     
+    @contextmanager
+    def _hold_console_output(self):
+        """
+        Buffer console log output and print it when the block is left.
+        
+        Records still go to process.log immediately; only the terminal output
+        is delayed, so it does not interleave with interactive input.
+        """
+        root_logger = logging.getLogger()
+        held = []
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+                buffer = logging.handlers.MemoryHandler(capacity=10000, flushLevel=logging.CRITICAL + 1,
+                                                        target=handler, flushOnClose=True)
+                root_logger.removeHandler(handler)
+                root_logger.addHandler(buffer)
+                held.append((buffer, handler))
+        try:
+            yield
+        finally:
+            for buffer, handler in held:
+                root_logger.removeHandler(buffer)
+                root_logger.addHandler(handler)
+                buffer.close()
+    
     def _log_model_limits(self, model_limits: Dict[str, Any]):
         """Log model limits in a formatted way following Google GenAI standards."""
         self.logger.info(f"Using model limits for {self.config.gemini_model}:")
@@ -284,29 +872,40 @@ class MeetingProcessor:
             # Step 2: Create target directory
             self._create_target_directory(recording_datetime)
             
-            # Step 3: Convert video
-            self._convert_video()
-            
-            # Step 4: Extract audio
-            self._extract_audio()
-            
-            # Step 5: Extract frames (if needed)
-            if prompt_type != "prompt_only_transcript.txt":
-                self._extract_frames()
-            
-            # Step 6: Create meeting.md
-            self._create_meeting_md()
-            
-            # Step 7: Select and copy prompt
-            self._select_and_copy_prompt(prompt_type)
-            
-            # Step 8: Create note.txt
-            self._create_note_txt(notes)
+            # Steps 3-6 are independent: media processing and meeting.md creation run in
+            # worker threads while the (possibly interactive) prompt and note steps stay
+            # on the main thread, as questionary needs the terminal.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 3: Convert video, extract audio and frames (if needed)
+                media_future = executor.submit(
+                    self._process_media,
+                    extract_frames=prompt_type != "prompt_only_transcript.txt"
+                )
+                
+                # Step 4: Create meeting.md
+                meeting_md_future = executor.submit(self._create_meeting_md)
+                
+                # Worker log lines would garble the questionary prompts and the note editor
+                with self._hold_console_output():
+                    try:
+                        # Step 5: Select and copy prompt
+                        self._select_and_copy_prompt(prompt_type)
+                        
+                        # Step 6: Create note.txt
+                        self._create_note_txt(notes)
+                    except BaseException:
+                        # Don't wait for the whole encode when leaving the executor
+                        self._cancel_media()
+                        raise
+                
+                # Propagate worker exceptions before uploading
+                media_future.result()
+                meeting_md_future.result()
             
-            # Step 9: Upload to Google Gemini
+            # Step 7: Upload to Google Gemini
             self._upload_to_gemini()
             
-            # Step 10: Cleanup
+            # Step 8: Cleanup
             if not self.config.no_cleanup:
                 self._cleanup()
             
@@ -366,16 +965,17 @@ class MeetingProcessor:
         try:
             # Try to extract creation date using ffprobe
             cmd = [
-                self.config.ffmpeg_path.replace("ffmpeg", "ffprobe"),
+                self.config.ffprobe_path,
                 "-v", "quiet",
                 "-print_format", "json",
-                "-show_format",
+                "-show_entries", "format_tags=creation_time",
                 self.video_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Raw bytes go straight into the JSON parser without a decode step
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
             if result.returncode == 0:
-                metadata = json.loads(result.stdout)
+                metadata = _json_loads(result.stdout)
                 creation_time = metadata.get('format', {}).get('tags', {}).get('creation_time')
                 if creation_time:
                     # Parse ISO format datetime
@@ -419,7 +1019,13 @@ class MeetingProcessor:
             self.logger.info(f"DRY RUN: Using placeholder time: {dt}")
             return dt
         
+        if not self.config.interactive:
+            raise RuntimeError("Manual date input is not available in batch mode "
+                               "(PREFERRED_DATE_SOURCE=manual, or no date in metadata and file time)")
+        
         # Ask user for the recording time
+        import questionary
+        
         self.logger.info("Please enter the recording date and time manually")
         custom_date = questionary.text(
             "Enter the recording date (YYYY-MM-DD):"
@@ -435,130 +1041,540 @@ class MeetingProcessor:
         """Create target directory with timestamp format or use specified directory."""
         if self.config.target_directory:
             # Use specified directory
-            self.target_dir = Path(self.config.target_directory)
+            self.target_dir = str(self.config.target_directory)
             if not self.config.dry_run:
-                self.target_dir.mkdir(parents=True, exist_ok=True)
+                self._make_target_directory()
                 self.logger.info(f"Using specified target directory: {self.target_dir}")
         else:
             # Create timestamp-based directory
             timestamp = recording_datetime.strftime("%Y-%m-%d_%H.%M")
-            self.target_dir = Path.cwd() / timestamp
+            self.target_dir = os.path.join(os.getcwd(), timestamp)
             
             if not self.config.dry_run:
-                self.target_dir.mkdir(exist_ok=True)
+                self._make_target_directory()
                 self.logger.info(f"Created target directory: {self.target_dir}")
         
-        # Update paths
-        self.audio_path = self.target_dir / "audio.m4a"
-        self.frames_dir = self.target_dir / "frames"
-        self.meeting_md_path = self.target_dir / "meeting.md"
-        self.note_path = self.target_dir / "note.txt"
-        self.prompt_path = self.target_dir / "prompt.txt"
-        self.process_log_path = self.target_dir / "process.log"
+        # Update paths (kept as strings, they are mostly passed to subprocesses)
+        self.audio_path = os.path.join(self.target_dir, "audio.m4a")
+        self.frames_dir = os.path.join(self.target_dir, "frames")
+        self.meeting_md_path = os.path.join(self.target_dir, "meeting.md")
+        self.note_path = os.path.join(self.target_dir, "note.txt")
+        self.prompt_path = os.path.join(self.target_dir, "prompt.txt")
+        self.process_log_path = os.path.join(self.target_dir, "process.log")
         
         # Update logging to include file handler now that directory exists
         self._update_logging_with_file()
     
-    def _convert_video(self):
-        """Convert video using HandBrakeCLI with JSON preset."""
-        self.logger.info("Converting video with HandBrakeCLI using JSON preset...")
+    def _make_target_directory(self):
+        """
+        Create self.target_dir.
+        
+        With exclusive_target_dir (batch jobs) an existing directory is never reused:
+        the first free name of target_dir, target_dir_2, target_dir_3, ... is created
+        atomically, so concurrent workers with the same timestamp or video name never
+        share (and clean up) each other's outputs.
+        """
+        if not self.config.exclusive_target_dir:
+            os.makedirs(self.target_dir, exist_ok=True)
+            return
+        
+        base_dir = self.target_dir
+        suffix = 1
+        while True:
+            try:
+                os.makedirs(self.target_dir)
+                return
+            except FileExistsError:
+                suffix += 1
+                self.target_dir = f"{base_dir}_{suffix}"
+    
+    def _load_handbrake_preset(self) -> Dict[str, Any]:
+        """Load the configured preset from the HandBrake JSON preset file."""
+        preset_file_path = _resolve_template_path(self.config.handbrake_preset_file)
+        
+        if not preset_file_path.exists():
+            raise FileNotFoundError(f"HandBrake preset file not found: {preset_file_path}")
+        
+        with open(preset_file_path, 'rb') as f:
+            preset_data = _json_loads(f.read())
+        
+        for preset in preset_data.get("PresetList", []):
+            if preset.get("PresetName") == self.config.handbrake_preset_name:
+                return preset
+        
+        raise ValueError(f"HandBrake preset '{self.config.handbrake_preset_name}' not found in {preset_file_path}")
+    
+    def _preset_video_encoder(self, preset: Dict[str, Any], software_only: bool = False) -> str:
+        """
+        Map the preset's VideoEncoder to an ffmpeg encoder for the non-NVENC path.
         
-        output_path = self.target_dir / "small.mp4"
+        VideoToolbox encoders fall back to libx264 outside macOS or when
+        software_only is set; unknown encoders use libx264.
+        """
+        encoder = self._FFMPEG_VIDEO_ENCODERS.get(preset.get("VideoEncoder"), "libx264")
+        if encoder.endswith("_videotoolbox") and (software_only or platform.system() != "Darwin"):
+            return "libx264"
+        return encoder
+    
+    def _video_encoder_args(self, preset: Dict[str, Any], use_nvenc: bool, software_only: bool = False) -> List[str]:
+        """Build ffmpeg video encoder arguments matching the HandBrake preset settings."""
+        args = []
+        
+        width = preset.get("PictureWidth", 0)
+        height = preset.get("PictureHeight", 0)
+        if width and height:
+            scale_filter = "scale_cuda" if use_nvenc else "scale"
+            args += ["-filter:v", f"{scale_filter}={width}:{height}:force_original_aspect_ratio=decrease"]
+        
+        # HandBrake presets also use "auto" (keep the source rate) here
+        framerate = preset.get("VideoFramerate")
+        try:
+            if float(framerate) > 0:
+                args += ["-r", str(framerate)]
+        except (TypeError, ValueError):
+            pass
+        
+        bitrate = preset.get("VideoAvgBitrate", 4000)
+        if use_nvenc:
+            # Frames stay in GPU memory between decoder and encoder, so no -pix_fmt here.
+            # Constant-quality VBR capped at the preset bitrate.
+            args += [
+                "-c:v", "h264_nvenc",
+                "-preset", self.config.nvenc_preset,
+                "-tune", "hq",
+                "-rc", "vbr",
+                "-cq", str(self.config.nvenc_cq),
+                "-b:v", "0",
+                "-maxrate", f"{bitrate}k",
+                "-bufsize", f"{bitrate * 2}k"
+            ]
+        else:
+            encoder = self._preset_video_encoder(preset, software_only)
+            args += ["-c:v", encoder]
+            if encoder.startswith("lib"):
+                args += ["-preset", "veryfast"]
+            
+            # The quality scale belongs to the preset's encoder (RF for x264/x265,
+            # 0-100 for VideoToolbox), so it only applies when that encoder is used
+            if preset.get("VideoQualityType") == 2 and encoder == self._FFMPEG_VIDEO_ENCODERS.get(preset.get("VideoEncoder")):
+                quality = str(preset.get("VideoQualitySlider", 22))
+                args += ["-q:v", quality] if encoder.endswith("_videotoolbox") else ["-crf", quality]
+            else:
+                args += ["-b:v", f"{bitrate}k"]
+            
+            if encoder in ("hevc_videotoolbox", "libx265"):
+                # QuickTime only plays HEVC in MP4 with the hvc1 tag
+                args += ["-tag:v", "hvc1"]
+        
+        return args
+    
+    def _audio_encoder_args(self, preset: Dict[str, Any]) -> List[str]:
+        """Build ffmpeg audio encoder arguments matching the HandBrake preset audio track."""
+        audio_settings = (preset.get("AudioList") or [{}])[0]
+        return ["-c:a", "aac", "-b:a", f"{audio_settings.get('AudioBitrate', 64)}k", "-ac", "2"]
+    
+    def _build_media_command(self, input_path: str, video_output: Optional[str],
+                             extract_frames: bool, use_nvenc: bool, software_only: bool = False) -> List[str]:
+        """
+        Build a single ffmpeg command producing the video outputs from one decode pass.
+        
+        Args:
+            input_path: Video to read (original video or HandBrake output)
+            video_output: Path for the transcoded video, or None if already converted
+            extract_frames: Whether to emit the JPEG frame ladder
+            use_nvenc: Whether to decode/encode on the GPU
+            software_only: Use a software encoder even if the preset names a hardware one
+        
+        Returns:
+            ffmpeg command line
+        """
+        cmd = [self.config.ffmpeg_path, "-hide_banner", "-nostats", "-y", "-threads", "0"]
+        
+        if use_nvenc:
+            # The decoder is not forced to h264_cuvid because the source may use another codec
+            cmd += ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+        
+        cmd += ["-i", input_path]
+        
+        if video_output is not None:
+            preset = self._load_handbrake_preset()
+            cmd += ["-map", "0:v:0", "-map", "0:a:0?"]
+            cmd += self._video_encoder_args(preset, use_nvenc, software_only)
+            cmd += self._audio_encoder_args(preset)
+            cmd += ["-movflags", "+faststart", video_output]
+        
+        if extract_frames:
+            frame_filter = f"fps=1/{self.config.frame_interval}"
+            if use_nvenc:
+                frame_filter += ",hwdownload,format=nv12"
+            cmd += [
+                "-map", "0:v:0",
+                "-filter:v", frame_filter,
+                "-q:v", "2",
+                os.path.join(self.frames_dir, "frame_%04d.jpg")
+            ]
         
-        # Get preset file path
-        preset_file_path = Path(__file__).parent / self.config.handbrake_preset_file
+        return cmd
+    
+    def _build_audio_command(self, input_path: str) -> List[str]:
+        """Build an audio-only ffmpeg command (demux and AAC encode, no video decode)."""
+        return [
+            self.config.ffmpeg_path, "-hide_banner", "-nostats", "-y",
+            "-i", input_path,
+            "-map", "0:a:0",
+            "-vn",
+            *self._audio_encoder_args(self._load_handbrake_preset()),
+            self.audio_path
+        ]
+    
+    def _build_handbrake_command(self, output_path: str) -> List[str]:
+        """Build the HandBrakeCLI command using the JSON preset."""
+        preset_file_path = _resolve_template_path(self.config.handbrake_preset_file)
         
         if not preset_file_path.exists():
             raise FileNotFoundError(f"HandBrake preset file not found: {preset_file_path}")
         
-        cmd = [
+        return [
             self.config.handbrake_path,
             "--preset-import-file", str(preset_file_path),
             "-Z", self.config.handbrake_preset_name,
-            "-i", str(self.video_path),
-            "-o", str(output_path)
+            "-i", self.video_path,
+            "-o", output_path
         ]
+    
+    def _start_logged(self, cmd: List[str]) -> subprocess.Popen:
+        """
+        Start an external tool with its stderr streamed directly into process.log.
         
-        if not self.config.dry_run:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"HandBrakeCLI failed: {result.stderr}")
+        Long encodes produce a lot of diagnostic output; writing it straight to the
+        log file avoids buffering and decoding it in Python.
+        """
+        with open(self.process_log_path, 'ab') as log_fh:
+            return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=log_fh)
+    
+    def _run_logged(self, cmd: List[str]) -> int:
+        """
+        Run an external tool with its stderr streamed into process.log.
+        
+        Returns:
+            Exit code of the command
+        """
+        return self._start_logged(cmd).wait()
+    
+    def _start_media_process(self, cmd: List[str]) -> subprocess.Popen:
+        """
+        Start the video encode so that _cancel_media can kill it.
+        
+        Raises:
+            RuntimeError: If media processing was already cancelled
+        """
+        with self._media_lock:
+            if self._media_cancelled:
+                raise RuntimeError("Media processing cancelled")
+            self._media_process = self._start_logged(cmd)
+            return self._media_process
+    
+    def _cancel_media(self):
+        """Kill the running video encode and prevent new ones from starting."""
+        with self._media_lock:
+            self._media_cancelled = True
+            if self._media_process is not None and self._media_process.poll() is None:
+                self.logger.info("Stopping media processing")
+                self._media_process.kill()
+    
+    def _process_log_tail(self, max_bytes: int = 4096) -> str:
+        """Return the last bytes of process.log for error messages."""
+        try:
+            with open(self.process_log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - max_bytes))
+                return f.read().decode('utf-8', errors='replace').strip()
+        except OSError:
+            return "(see process.log)"
+    
+    def _process_media(self, extract_frames: bool = True):
+        """
+        Convert video and extract audio and frames.
+        
+        The video encode (ffmpeg with the frame ladder fused in, or HandBrakeCLI)
+        runs as a background process. Meanwhile a fast audio-only pass extracts
+        audio.m4a and its Gemini upload is started, so the upload overlaps the encode.
+        """
+        output_path = os.path.join(self.target_dir, "small.mp4")
+        
+        if not self.config.dry_run and extract_frames:
+            os.makedirs(self.frames_dir, exist_ok=True)
+        
+        use_nvenc = False
+        hardware_encoder = False
+        if self.config.use_handbrake:
+            self.logger.info("Converting video with HandBrakeCLI using JSON preset...")
+            video_cmd = self._build_handbrake_command(output_path)
+        else:
+            use_nvenc = self.config.nvenc_usable
+            encoder = "h264_nvenc" if use_nvenc else self._preset_video_encoder(self._load_handbrake_preset())
+            hardware_encoder = use_nvenc or encoder.endswith("_videotoolbox")
             
-            # Verify that the output file was actually created
-            if not output_path.exists():
-                raise RuntimeError(f"HandBrakeCLI reported success but output file was not created: {output_path}")
+            if use_nvenc:
+                self.logger.info("Processing media with ffmpeg using NVENC hardware encoding...")
+            else:
+                self.logger.info(f"NVENC test encode failed or not supported, processing media with ffmpeg ({encoder})...")
             
-            # Check file size to ensure it's not empty
-            if output_path.stat().st_size == 0:
-                raise RuntimeError(f"HandBrakeCLI created empty output file: {output_path}")
+            video_cmd = self._build_media_command(self.video_path, output_path, extract_frames, use_nvenc)
+        
+        audio_cmd = self._build_audio_command(self.video_path)
+        
+        if self.config.dry_run:
+            self.logger.info(f"DRY RUN: Would run: {' '.join(video_cmd)}")
+            self.logger.info(f"DRY RUN: Would run: {' '.join(audio_cmd)}")
+            if self.config.use_handbrake and extract_frames:
+                frames_cmd = self._build_media_command(output_path, None, extract_frames=True, use_nvenc=False)
+                self.logger.info(f"DRY RUN: Would run: {' '.join(frames_cmd)}")
+            return
+        
+        video_process = self._start_media_process(video_cmd)
+        
+        if self._run_logged(audio_cmd) != 0:
+            video_process.kill()
+            video_process.wait()
+            raise RuntimeError(f"Audio extraction failed: {self._process_log_tail()}")
+        
+        self.logger.info("Audio extraction completed")
+        if not self._media_cancelled:
+            self._start_audio_upload()
+        
+        returncode = video_process.wait()
+        
+        if returncode != 0 and hardware_encoder and not self._media_cancelled:
+            self.logger.warning(f"Hardware encoding failed, retrying with software encoding: {self._process_log_tail(500)}")
+            video_cmd = self._build_media_command(self.video_path, output_path, extract_frames,
+                                                  use_nvenc=False, software_only=True)
+            returncode = self._start_media_process(video_cmd).wait()
+        
+        tool = "HandBrakeCLI" if self.config.use_handbrake else "ffmpeg"
+        if returncode != 0:
+            raise RuntimeError(f"{tool} failed: {self._process_log_tail()}")
+        
+        # Verify that the output file was actually created and is not empty
+        if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+            raise RuntimeError(f"{tool} reported success but output file is missing or empty: {output_path}")
+        
+        self.logger.info("Video conversion completed")
+        
+        if self.config.use_handbrake and extract_frames:
+            self._extract_frames(output_path)
+        
+        self.logger.info("Media processing completed")
+    
+    def _extract_frames(self, input_path: str):
+        """Extract frames from an already converted video."""
+        self.logger.info("Extracting frames...")
+        
+        if self._extract_frames_gpu(input_path) or self._extract_frames_seek(input_path):
+            return
+        
+        cmd = self._build_media_command(input_path, None, extract_frames=True, use_nvenc=False)
+        if self._run_logged(cmd) != 0:
+            raise RuntimeError(f"Frame extraction failed: {self._process_log_tail()}")
+        
+        self.logger.info("Frame extraction completed")
+    
+    def _get_gemini_client(self):
+        """Create the Google GenAI client on first use."""
+        if self._gemini_client is None:
+            try:
+                # Import the modern Google GenAI SDK
+                genai, _ = _import_genai()
+            except ImportError:
+                self.logger.error("Google GenAI SDK not installed. Please install it with: pip install google-genai")
+                raise
             
-            self.logger.info("Video conversion completed")
-        else:
-            self.logger.info(f"DRY RUN: Would run: {' '.join(cmd)}")
+            self._gemini_client = genai.Client(api_key=self.config.gemini_api_key,
+                                               http_options=self._gemini_http_options())
+        
+        return self._gemini_client
     
-    def _extract_audio(self):
-        """Extract audio from converted video."""
-        self.logger.info("Extracting audio...")
+    def _gemini_http_options(self):
+        """
+        Build HTTP options with one keep-alive connection pool for all Gemini requests.
         
-        input_path = self.target_dir / "small.mp4"
-        cmd = [
-            self.config.ffmpeg_path,
-            "-i", str(input_path),
-            "-vn",
-            "-c:a", "copy",
-            str(self.audio_path)
-        ]
+        Uploads, generate_content and deletes then reuse open connections (HTTP/2 when
+        the h2 package is installed) instead of paying a TLS handshake per file.
         
-        if not self.config.dry_run:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"Audio extraction failed: {result.stderr}")
-            self.logger.info("Audio extraction completed")
-        else:
-            self.logger.info(f"DRY RUN: Would run: {' '.join(cmd)}")
+        Returns:
+            types.HttpOptions, or None to use the SDK defaults
+        """
+        try:
+            import httpx
+            _, types = _import_genai()
+        except ImportError:
+            return None
+        
+        pool_size = max(32, self.config.upload_concurrency)
+        client_args = {
+            "http2": importlib.util.find_spec("h2") is not None,
+            "limits": httpx.Limits(max_keepalive_connections=pool_size, max_connections=pool_size)
+        }
+        
+        try:
+            return types.HttpOptions(client_args=client_args, async_client_args=client_args)
+        except (TypeError, ValueError) as e:
+            # Older google-genai releases do not accept custom client arguments
+            self.logger.debug(f"Using default Gemini HTTP options: {e}")
+            return None
     
-    def _extract_frames(self):
-        """Extract frames from video."""
-        self.logger.info("Extracting frames...")
+    def _start_audio_upload(self):
+        """Start uploading audio.m4a to Gemini in the background."""
+        if not self.config.gemini_api_key:
+            return
+        
+        client = self._get_gemini_client()
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._audio_upload = executor.submit(
+            self._retry_with_exponential_backoff,
+            lambda: client.files.upload(file=self.audio_path),
+            base_delay=self._UPLOAD_RETRY_BASE_DELAY
+        )
+        executor.shutdown(wait=False)
+        self.logger.info("Started audio upload to Gemini while video processing continues")
+    
+    def _discard_audio_upload(self):
+        """Delete an audio file uploaded ahead of time if processing failed afterwards."""
+        if self._audio_upload is None:
+            return
         
-        if not self.config.dry_run:
-            self.frames_dir.mkdir(exist_ok=True)
-        
-        input_path = self.target_dir / "small.mp4"
-        cmd = [
-            self.config.ffmpeg_path,
-            "-i", str(input_path),
-            "-vf", f"fps=1/{self.config.frame_interval}",
-            "-q:v", "2",
-            str(self.frames_dir / "frame_%04d.jpg")
-        ]
+        try:
+            uploaded_file = self._audio_upload.result()
+            self._get_gemini_client().files.delete(name=uploaded_file.name)
+            self.logger.info("Removed uploaded audio file from Gemini")
+        except Exception as e:
+            self.logger.warning(f"Failed to remove uploaded audio file: {e}")
+        finally:
+            self._audio_upload = None
+    
+    def _extract_frames_gpu(self, input_path: str, batch_size: int = 16) -> bool:
+        """
+        Extract frames with NVDEC via PyNvVideoCodec and encode them as JPEG on the GPU.
         
-        if not self.config.dry_run:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"Frame extraction failed: {result.stderr}")
-            self.logger.info("Frame extraction completed")
-        else:
-            self.logger.info(f"DRY RUN: Would run: {' '.join(cmd)}")
+        Only the sampled frames are decoded and they never leave GPU memory until
+        the JPEG bytes are written.
+        
+        Args:
+            input_path: Video to extract frames from
+            batch_size: Number of frames decoded and JPEG-encoded per batch
+        
+        Returns:
+            True if frames were extracted, False if the ffmpeg path should be used
+        """
+        try:
+            import PyNvVideoCodec as nvc
+            import torch
+            from torchvision.io import encode_jpeg
+        except ImportError:
+            return False
+        
+        self.logger.info("Extracting frames with PyNvVideoCodec (NVDEC)...")
+        
+        try:
+            decoder = nvc.SimpleDecoder(
+                input_path,
+                gpu_id=0,
+                use_device_memory=True,
+                output_color_type=nvc.OutputColorType.RGBP
+            )
+            metadata = decoder.get_stream_metadata()
+            step = max(1, round(metadata.average_fps * self.config.frame_interval))
+            indices = list(range(0, metadata.num_frames, step))
+            
+            frame_number = 1
+            for batch_start in range(0, len(indices), batch_size):
+                frames = decoder.get_batch_frames_by_index(indices[batch_start:batch_start + batch_size])
+                encoded_frames = encode_jpeg([torch.from_dlpack(frame) for frame in frames], quality=95)
+                
+                for encoded in encoded_frames:
+                    frame_path = os.path.join(self.frames_dir, f"frame_{frame_number:04d}.jpg")
+                    with open(frame_path, 'wb') as f:
+                        f.write(encoded.cpu().numpy().tobytes())
+                    frame_number += 1
+        except Exception as e:
+            self.logger.warning(f"GPU frame extraction failed, falling back to ffmpeg: {e}")
+            for frame_file in Path(self.frames_dir).glob("frame_*.jpg"):
+                frame_file.unlink()
+            return False
+        
+        self.logger.info(f"Extracted {frame_number - 1} frames on the GPU")
+        return True
+    
+    def _extract_frames_seek(self, input_path: str) -> bool:
+        """
+        Extract frames with PyAV by seeking to the keyframe before each sample time.
+        
+        Instead of decoding the whole video and dropping all but one frame per
+        interval (ffmpeg fps filter), only the frames between the preceding
+        keyframe and each sample timestamp are decoded.
+        
+        Args:
+            input_path: Video to extract frames from
+        
+        Returns:
+            True if frames were extracted, False if the ffmpeg path should be used
+        """
+        try:
+            import av
+            import PIL.Image  # noqa: F401 - required by VideoFrame.to_image()
+        except ImportError:
+            return False
+        
+        self.logger.info("Extracting frames with PyAV keyframe seeking...")
+        
+        frame_number = 1
+        try:
+            with av.open(input_path) as container:
+                stream = container.streams.video[0]
+                stream.thread_type = "AUTO"
+                
+                if stream.duration is not None:
+                    duration = float(stream.duration * stream.time_base)
+                else:
+                    duration = container.duration / av.time_base
+                
+                for target in range(0, int(duration) + 1, self.config.frame_interval):
+                    container.seek(int(target / stream.time_base), stream=stream,
+                                   backward=True, any_frame=False)
+                    frame = None
+                    for frame in container.decode(stream):
+                        # Decode forward from the keyframe up to the sample time
+                        if frame.time is None or frame.time >= target:
+                            break
+                    if frame is None:
+                        break
+                    
+                    frame_path = os.path.join(self.frames_dir, f"frame_{frame_number:04d}.jpg")
+                    frame.to_image().save(frame_path, quality=95)
+                    frame_number += 1
+        except Exception as e:
+            self.logger.warning(f"PyAV frame extraction failed, falling back to ffmpeg: {e}")
+            for frame_file in Path(self.frames_dir).glob("frame_*.jpg"):
+                frame_file.unlink()
+            return False
+        
+        self.logger.info(f"Extracted {frame_number - 1} frames with PyAV")
+        return True
     
     def _create_meeting_md(self):
         """Create empty meeting.md file."""
         self.logger.info("Creating meeting.md...")
         
         if not self.config.dry_run:
-            self.meeting_md_path.touch()
+            # Plain create instead of touch() to skip the extra utime call
+            open(self.meeting_md_path, 'wb').close()
             self.logger.info("Created meeting.md")
         else:
             self.logger.info("DRY RUN: Would create meeting.md")
     
     def _resolve_prompt_shortcut(self, prompt_input: str) -> str:
         """Resolve prompt shortcuts to actual file names."""
-        shortcut_mapping = {
-            "only transcript": "prompt_only_transcript.txt",
-            "without transcript": "prompt_wo_transcript.txt"
-        }
-        
-        return shortcut_mapping.get(prompt_input.lower(), prompt_input)
+        return self._SHORTCUTS.get(prompt_input.lower(), prompt_input)
     
     def _select_and_copy_prompt(self, prompt_type: Optional[str] = None):
         """Select and copy the appropriate prompt template."""
@@ -569,28 +1585,26 @@ class MeetingProcessor:
             prompt_file = self._resolve_prompt_shortcut(prompt_type)
         elif self.config.default_prompt:
             prompt_file = self._resolve_prompt_shortcut(self.config.default_prompt)
+        elif not self.config.interactive:
+            raise ValueError("No prompt template given: pass --prompt or set DEFAULT_PROMPT for batch mode")
         else:
             # Interactive selection
             if not self.config.dry_run:
+                import questionary
+                
                 prompt_file = questionary.select(
                     "Select prompt template:",
-                    choices=[
-                        "prompt.txt - Full analysis with transcript and visual content",
-                        "prompt_wo_transcript.txt - Analysis without transcript (visual only)",
-                        "prompt_only_transcript.txt - Transcript-only analysis (no visual content)",
-                        "only transcript - Shortcut for transcript-only",
-                        "without transcript - Shortcut for visual-only"
-                    ]
+                    choices=list(self._PROMPT_CHOICES)
                 ).ask()
                 prompt_file = self._resolve_prompt_shortcut(prompt_file.split(" - ")[0])
             else:
                 prompt_file = "prompt.txt"  # Default for dry run
         
         # Copy prompt file to target directory
-        source_prompt = Path(__file__).parent / prompt_file
+        source_prompt = _resolve_template_path(prompt_file)
         if source_prompt.exists():
             if not self.config.dry_run:
-                shutil.copy2(source_prompt, self.prompt_path)
+                shutil.copyfile(source_prompt, self.prompt_path)
                 self.logger.info(f"Copied prompt template: {prompt_file}")
             else:
                 self.logger.info(f"DRY RUN: Would copy prompt template: {prompt_file}")
@@ -601,10 +1615,14 @@ class MeetingProcessor:
         """Create note.txt with user input."""
         self.logger.info("Creating note.txt...")
         
-        if notes:
+        if notes is not None:
             note_content = notes
+        elif not self.config.interactive:
+            note_content = ""
         else:
             if not self.config.dry_run:
+                import questionary
+                
                 # Ask user for input method
                 input_method = questionary.select(
                     "How would you like to input notes?",
@@ -636,58 +1654,72 @@ class MeetingProcessor:
                 note_content = "# DRY RUN - Notes would be entered here\n"
         
         if not self.config.dry_run:
-            with open(self.note_path, 'w', encoding='utf-8') as f:
-                f.write(note_content)
+            # One large buffer: long piped-in notes go out in a single write(2)
+            with open(self.note_path, 'wb', buffering=1 << 20) as f:
+                f.write(note_content.encode('utf-8'))
             self.logger.info("Created note.txt")
         else:
             self.logger.info("DRY RUN: Would create note.txt with user input")
     
-    def _retry_with_exponential_backoff(self, func, max_retries=5, base_delay=60):
+    def _is_503_error(self, e: Exception) -> bool:
+        """Check whether an exception represents a 503 UNAVAILABLE error."""
+        # Known 503 exception types need no attribute or string probing
+        if type(e) in _retryable_types():
+            return True
+        
+        # Check for HTTP status code attributes (google.genai errors expose .code)
+        code = getattr(e, 'code', None)
+        if getattr(e, 'status_code', None) == 503 or code == 503:
+            return True
+        
+        # Check for gRPC status codes; grpc can only be involved if it is already imported
+        grpc = sys.modules.get('grpc')
+        if grpc is not None:
+            if callable(code):
+                try:
+                    code = code()
+                except Exception:
+                    code = None
+            if code is grpc.StatusCode.UNAVAILABLE:
+                return True
+        
+        if getattr(e, 'status', None) == 'UNAVAILABLE':
+            return True
+        
+        # Only unknown errors fall back to message, details and string representation
+        if hasattr(e, 'message') and '503' in str(e.message):
+            return True
+        if hasattr(e, 'details') and '503' in str(e.details):
+            return True
+        error_text = str(e)
+        return '503' in error_text and 'UNAVAILABLE' in error_text
+    
+    async def _retry_with_exponential_backoff_async(self, coro_factory, max_retries=5, base_delay=60):
         """
-        Retry a function with exponential backoff for 503 errors.
+        Retry an awaitable with exponential backoff and full jitter for 503 errors.
         
         Args:
-            func: Function to retry
+            coro_factory: Callable returning a new awaitable for each attempt
             max_retries: Maximum number of retry attempts
-            base_delay: Base delay in seconds (will be doubled each retry)
+            base_delay: Base delay in seconds (the backoff cap is doubled each retry)
         
         Returns:
-            Result of the function if successful
+            Result of the awaitable if successful
         
         Raises:
             Exception: If all retries fail or if a non-503 error occurs
         """
-        import time
-        
         for attempt in range(max_retries + 1):  # +1 for initial attempt
             try:
-                return func()
+                return await coro_factory()
             except Exception as e:
-                # Check if it's a 503 error - handle different error structures
-                is_503_error = False
-                
-                # Check for status_code attribute
-                if hasattr(e, 'status_code') and e.status_code == 503:
-                    is_503_error = True
-                
-                # Check for error message containing 503
-                elif hasattr(e, 'message') and '503' in str(e.message):
-                    is_503_error = True
-                
-                # Check for error details containing 503
-                elif hasattr(e, 'details') and '503' in str(e.details):
-                    is_503_error = True
-                
-                # Check for error string containing 503 UNAVAILABLE
-                elif '503' in str(e) and 'UNAVAILABLE' in str(e):
-                    is_503_error = True
-                
-                if is_503_error:
+                if self._is_503_error(e):
                     if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)  # 1, 2, 4, 8, 16 minutes
+                        # Full jitter: sleep a random time up to base_delay * 1, 2, 4, 8, 16
+                        delay = random.uniform(0, base_delay * (2 ** attempt))
                         self.logger.warning(f"503 UNAVAILABLE error (attempt {attempt + 1}/{max_retries + 1}). "
-                                          f"Retrying in {delay} seconds...")
-                        time.sleep(delay)
+                                          f"Retrying in {delay:.0f} seconds...")
+                        await asyncio.sleep(delay)
                         continue
                     else:
                         self.logger.error(f"All {max_retries + 1} attempts failed with 503 UNAVAILABLE error")
@@ -700,14 +1732,28 @@ class MeetingProcessor:
         # This should never be reached, but just in case
         raise RuntimeError("Unexpected error in retry logic")
     
+    def _retry_with_exponential_backoff(self, func, max_retries=5, base_delay=60):
+        """
+        Retry a blocking function with exponential backoff for 503 errors.
+        
+        Synchronous wrapper around _retry_with_exponential_backoff_async; the
+        function runs in the default executor so the event loop stays free.
+        """
+        async def call_in_executor():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, func)
+        
+        return asyncio.run(self._retry_with_exponential_backoff_async(call_in_executor, max_retries, base_delay))
+    
     def _cleanup_on_failure(self):
         """Clean up created directory and files on failure, preserving original video."""
         self.logger.info("Cleaning up created files due to failure...")
         
+        self._discard_audio_upload()
+        
         try:
-            if self.target_dir.exists():
-                import shutil
-                shutil.rmtree(self.target_dir)
+            if os.path.isdir(self.target_dir):
+                _fast_rmtree(self.target_dir)
                 self.logger.info(f"Removed target directory: {self.target_dir}")
         except Exception as e:
             self.logger.warning(f"Failed to cleanup target directory: {e}")
@@ -719,81 +1765,103 @@ class MeetingProcessor:
         if not self.config.gemini_api_key:
             raise ValueError("Gemini API key not configured")
         
-        try:
-            # Import the modern Google GenAI SDK
-            from google import genai
-            from google.genai import types
-        except ImportError:
-            self.logger.error("Google GenAI SDK not installed. Please install it with: pip install google-genai")
-            raise
-        
         # Setup client
-        client = genai.Client(api_key=self.config.gemini_api_key)
+        client = self._get_gemini_client()
+        _, types = _import_genai()
         
         # Read prompt
         if self.config.dry_run:
             prompt_text = "# DRY RUN - Prompt content would be read here"
         else:
-            with open(self.prompt_path, 'r', encoding='utf-8') as f:
-                prompt_text = f.read()
+            with open(self.prompt_path, 'rb') as f:
+                prompt_text = f.read().decode('utf-8')
         
         # Get model limits for the current model
         model_limits = self.config.get_model_limits(self.config.gemini_model)
         self._log_model_limits(model_limits)
         
-        # Check input token limit for prompt
+        # Count prompt tokens in the background while the files are collected and uploaded
         if not self.config.dry_run:
-            prompt_tokens = client.models.count_tokens(
-                model=self.config.gemini_model,
-                contents=prompt_text
-            ).total_tokens
-            self.logger.info(f"Prompt tokens: {prompt_tokens}")
-            
-            max_input_tokens = model_limits.get("max_input_tokens", 1048576)
-            if prompt_tokens > max_input_tokens:
-                self.logger.warning(f"Prompt tokens ({prompt_tokens}) exceed limit ({max_input_tokens})")
+            executor = ThreadPoolExecutor(max_workers=1)
+            prompt_token_count = executor.submit(self._count_prompt_tokens, client, prompt_text)
+            executor.shutdown(wait=False)
         
         # Collect all files to upload
         files_to_upload = []
         
         # Add audio file
-        if self.audio_path.exists():
+        if os.path.exists(self.audio_path):
             # Check audio duration limits (not file size)
             try:
-                import subprocess
-                result = subprocess.run([
-                    self.config.ffmpeg_path.replace("ffmpeg", "ffprobe"), 
-                    '-v', 'quiet', 
-                    '-show_entries', 'format=duration',
-                    '-of', 'default=noprint_wrappers=1:nokey=1', 
-                    str(self.audio_path)
-                ], capture_output=True, text=True, check=True)
-                audio_duration_hours = float(result.stdout.strip()) / 3600
+                audio_duration_hours = self._get_media_duration(self.audio_path) / 3600
                 max_audio_hours = model_limits.get("max_audio_length_hours", 8.4)
                 if audio_duration_hours > max_audio_hours:
                     self.logger.warning(f"Audio duration ({audio_duration_hours:.2f} hours) exceeds limit ({max_audio_hours} hours)")
             except Exception as e:
                 self.logger.warning(f"Could not check audio duration: {e}")
-            files_to_upload.append(('audio', self.audio_path))
+            
+            # Audio upload may already be in flight since media processing
+            if self._audio_upload is None:
+                files_to_upload.append(('audio', self.audio_path))
+        
+        # Small content is sent inline with the generate_content request while it fits
+        # into the request size limit, which saves an upload and a delete round-trip per file.
+        # Inline data is base64-encoded in the request, so parts are charged at that size.
+        inline_budget = self._INLINE_BYTES_LIMIT - self._INLINE_HEADROOM - len(prompt_text.encode('utf-8'))
+        
+        # note.txt is reserved first, it is small and never duplicated
+        note_size = os.path.getsize(self.note_path) if os.path.exists(self.note_path) else 0
+        inline_note = 0 < note_size and _base64_size(note_size) <= inline_budget
+        if inline_note:
+            inline_budget -= _base64_size(note_size)
         
         # Add frames if they exist
-        if self.frames_dir.exists():
-            frame_files = list(self.frames_dir.glob("*.jpg"))
+        inline_frames = []
+        upload_frame_hashes = []  # Content hash of each uploaded frame slot, in frame order
+        upload_frame_paths = {}  # Content hash -> first frame with that content
+        if os.path.isdir(self.frames_dir):
+            # Single directory pass: frame paths and sizes in two parallel lists, in frame order
+            with os.scandir(self.frames_dir) as entries:
+                frames = sorted((entry.path, entry.stat().st_size) for entry in entries if entry.name.endswith(".jpg"))
+            frame_paths = [frame_path for frame_path, _ in frames]
+            frame_sizes = [frame_size for _, frame_size in frames]
             max_images = model_limits.get("max_images_per_prompt", 3000)
             
-            if len(frame_files) > max_images:
-                self.logger.warning(f"Number of frames ({len(frame_files)}) exceeds limit ({max_images}), limiting to first {max_images}")
-                frame_files = frame_files[:max_images]
+            if len(frame_paths) > max_images:
+                self.logger.warning(f"Number of frames ({len(frame_paths)}) exceeds limit ({max_images}), limiting to first {max_images}")
+                frame_paths = frame_paths[:max_images]
+                frame_sizes = frame_sizes[:max_images]
+            
+            # Check image size limit once over all sizes, with a single aggregated warning
+            max_image_size_mb = model_limits.get("max_image_size_mb", 7)
+            max_image_bytes = max_image_size_mb * 1024 * 1024
+            oversize = [os.path.basename(frame_path) for frame_path, frame_size in zip(frame_paths, frame_sizes)
+                        if frame_size > max_image_bytes]
+            if oversize:
+                self.logger.warning(f"{len(oversize)} frames exceed the image size limit ({max_image_size_mb} MB): {', '.join(oversize)}")
             
-            for frame_file in frame_files:
-                # Check image size limit
-                image_size_mb = frame_file.stat().st_size / (1024 * 1024)
-                if image_size_mb > model_limits.get("max_image_size_mb", 7):
-                    self.logger.warning(f"Image file {frame_file.name} size ({image_size_mb:.2f} MB) exceeds limit ({model_limits.get('max_image_size_mb', 7)} MB)")
-                files_to_upload.append(('frame', frame_file))
-        
-        # Add note.txt if it exists and has content
-        if self.note_path.exists() and self.note_path.stat().st_size > 0:
+            # Identical frames (e.g. a slide shown for several minutes) are uploaded once
+            frame_hashes = [_hash_file(frame_path) for frame_path in frame_paths]
+            
+            for index, (frame_path, frame_size, frame_hash) in enumerate(zip(frame_paths, frame_sizes, frame_hashes)):
+                # Stop inlining at the first frame that does not fit so frames stay in order
+                if len(inline_frames) == index and _base64_size(frame_size) <= inline_budget:
+                    inline_frames.append((frame_path, frame_hash))
+                    inline_budget -= _base64_size(frame_size)
+                else:
+                    if frame_hash not in upload_frame_paths:
+                        upload_frame_paths[frame_hash] = frame_path
+                        files_to_upload.append(('frame', frame_path))
+                    upload_frame_hashes.append(frame_hash)
+            
+            if inline_frames:
+                self.logger.info(f"Sending {len(inline_frames)}/{len(frame_paths)} frames inline with the request")
+            duplicate_count = len(upload_frame_hashes) - len(upload_frame_paths)
+            if duplicate_count:
+                self.logger.info(f"Skipping upload of {duplicate_count} duplicate frames")
+        
+        # Upload note.txt if it has content but does not fit inline
+        if note_size > 0 and not inline_note:
             files_to_upload.append(('note', self.note_path))
         
         if not self.config.dry_run:
@@ -801,43 +1869,61 @@ class MeetingProcessor:
             uploaded_files = {}
             total_files = len(files_to_upload)
             
+            if self._audio_upload is not None:
+                try:
+                    uploaded_files['audio'] = self._audio_upload.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to upload {os.path.basename(self.audio_path)}: {e}")
+                    raise  # Audio is critical, fail if it can't be uploaded
+                finally:
+                    self._audio_upload = None
+            
             if total_files > 0:
-                # Print initial status line with timestamp
-                import time
-                start_time = time.time()
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-                print(f"{timestamp} - INFO - Uploading files to Gemini: 0/{total_files}", end='', flush=True)
+                self.logger.info(f"Uploading {total_files} files to Gemini...")
                 
-                for i, (file_type, file_path) in enumerate(files_to_upload, 1):
-                    try:
-                        if file_type == 'audio':
-                            uploaded_file = client.files.upload(file=str(file_path))
-                            uploaded_files['audio'] = uploaded_file
-                        elif file_type == 'frame':
-                            if 'frames' not in uploaded_files:
-                                uploaded_files['frames'] = []
-                            uploaded_file = client.files.upload(file=str(file_path))
-                            uploaded_files['frames'].append(uploaded_file)
-                        elif file_type == 'note':
-                            uploaded_file = client.files.upload(file=str(file_path))
-                            uploaded_files['note'] = uploaded_file
-                        
-                        # Update progress line in place with file type indicator
-                        file_type_display = file_type.upper()
-                        print(f"\r{timestamp} - INFO - Uploading files to Gemini: {i}/{total_files} ({file_type_display})", end='', flush=True)
-                        
-                        # Small delay to ensure progress is visible even for fast uploads
-                        time.sleep(0.1)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Failed to upload {file_path.name}: {e}")
-                        if file_type == 'audio':
-                            print()  # New line after progress
-                            raise  # Audio is critical, fail if it can't be uploaded
-                        # Continue with other files for non-critical uploads
+                # Progress bar on stderr when tqdm is installed (hidden when not attached to a terminal)
+                progress = tqdm(total=total_files, desc="Uploading to Gemini", unit="file",
+                                disable=None) if tqdm is not None else None
+                
+                def show_progress(completed: int, file_type: str):
+                    if progress is not None:
+                        progress.set_postfix_str(file_type, refresh=False)
+                        progress.update(1)
+                
+                try:
+                    results = asyncio.run(self._upload_files_async(client, files_to_upload, show_progress))
+                finally:
+                    if progress is not None:
+                        progress.close()
+                
+                frame_hash_by_path = {frame_path: frame_hash for frame_hash, frame_path in upload_frame_paths.items()}
+                uploaded_frames = {}
+                for (file_type, file_path), uploaded_file in zip(files_to_upload, results):
+                    if uploaded_file is None:
+                        continue
+                    if file_type == 'frame':
+                        uploaded_frames[frame_hash_by_path[file_path]] = uploaded_file
+                    else:
+                        uploaded_files[file_type] = uploaded_file
+                
+                # Duplicate frames point at the upload of their first occurrence
+                if uploaded_frames:
+                    uploaded_files['frames'] = [uploaded_frames[frame_hash] for frame_hash in upload_frame_hashes
+                                                if frame_hash in uploaded_frames]
+                
+                uploaded_count = sum(uploaded_file is not None for uploaded_file in results)
+                self.logger.info(f"Uploaded {uploaded_count}/{total_files} files to Gemini")
+            
+            # Check input token limit for prompt
+            try:
+                prompt_tokens = prompt_token_count.result()
+                self.logger.info(f"Prompt tokens: {prompt_tokens}")
                 
-                # Final status update and new line
-                print(f"\r{timestamp} - INFO - Uploading files to Gemini: {total_files}/{total_files} completed")
+                max_input_tokens = model_limits.get("max_input_tokens", 1048576)
+                if prompt_tokens > max_input_tokens:
+                    self.logger.warning(f"Prompt tokens ({prompt_tokens}) exceed limit ({max_input_tokens})")
+            except Exception as e:
+                self.logger.warning(f"Could not count prompt tokens: {e}")
             
             # Prepare content for Gemini
             content_parts = [prompt_text]
@@ -846,10 +1932,20 @@ class MeetingProcessor:
             if 'audio' in uploaded_files:
                 content_parts.append(uploaded_files['audio'])
             
+            inline_parts = {}
+            for frame_path, frame_hash in inline_frames:
+                if frame_hash not in inline_parts:
+                    with open(frame_path, 'rb') as f:
+                        inline_parts[frame_hash] = types.Part.from_bytes(data=f.read(), mime_type='image/jpeg')
+                content_parts.append(inline_parts[frame_hash])
+            
             if 'frames' in uploaded_files:
                 content_parts.extend(uploaded_files['frames'])
             
-            if 'note' in uploaded_files:
+            if inline_note:
+                with open(self.note_path, 'rb') as f:
+                    content_parts.append(types.Part.from_bytes(data=f.read(), mime_type='text/plain'))
+            elif 'note' in uploaded_files:
                 content_parts.append(uploaded_files['note'])
             
             # Generate content with Gemini using retry logic
@@ -881,8 +1977,8 @@ class MeetingProcessor:
             
             if response.text:
                 # Save to meeting.md
-                with open(self.meeting_md_path, 'w', encoding='utf-8') as f:
-                    f.write(response.text)
+                with open(self.meeting_md_path, 'wb') as f:
+                    f.write(response.text.encode('utf-8'))
                 
                 self.logger.info("Gemini analysis completed and saved to meeting.md")
             else:
@@ -891,41 +1987,187 @@ class MeetingProcessor:
             # Cleanup uploaded files
             if uploaded_files:
                 self.logger.info("Cleaning up uploaded files...")
-                cleanup_count = 0
-                total_to_cleanup = 0
+                file_names = [uploaded_files[key].name for key in ('audio', 'note') if key in uploaded_files]
+                # Duplicate frames share one upload, which is deleted once
+                file_names += list(dict.fromkeys(frame.name for frame in uploaded_files.get('frames', [])))
                 
-                try:
-                    if 'audio' in uploaded_files:
-                        total_to_cleanup += 1
-                        client.files.delete(name=uploaded_files['audio'].name)
-                        cleanup_count += 1
-                    
-                    if 'frames' in uploaded_files:
-                        total_to_cleanup += len(uploaded_files['frames'])
-                        for frame in uploaded_files['frames']:
-                            client.files.delete(name=frame.name)
-                            cleanup_count += 1
-                    
-                    if 'note' in uploaded_files:
-                        total_to_cleanup += 1
-                        client.files.delete(name=uploaded_files['note'].name)
-                        cleanup_count += 1
-                    
-                    self.logger.info(f"Cleaned up {cleanup_count}/{total_to_cleanup} uploaded files")
-                except Exception as e:
-                    self.logger.warning(f"Failed to cleanup some uploaded files: {e}")
+                def delete_file(name: str) -> bool:
+                    try:
+                        client.files.delete(name=name)
+                        return True
+                    except Exception as e:
+                        self.logger.warning(f"Failed to cleanup uploaded file {name}: {e}")
+                        return False
+                
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    cleanup_count = sum(executor.map(delete_file, file_names))
+                
+                self.logger.info(f"Cleaned up {cleanup_count}/{len(file_names)} uploaded files")
         else:
             self.logger.info("DRY RUN: Would upload files to Gemini and save results")
     
+    async def _upload_files_async(self, client, files_to_upload: List[Tuple[str, str]], on_progress) -> List[Any]:
+        """
+        Upload files concurrently with the async Gemini client.
+        
+        File contents are read in worker threads (or batched through io_uring when
+        use_uring is enabled), so reading the next files from disk overlaps with
+        the uploads already in flight.
+        
+        Args:
+            client: Google GenAI client
+            files_to_upload: (file_type, file_path) tuples
+            on_progress: Called with (completed, file_type) after each finished upload
+        
+        Returns:
+            Uploaded files in the order of files_to_upload (None for failed non-critical uploads)
+        
+        Raises:
+            Exception: If the audio upload fails
+        """
+        _, types = _import_genai()
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(1, self.config.upload_concurrency))
+        
+        uring = None
+        if self.config.use_uring:
+            if _io_uring_available():
+                try:
+                    uring = IoUringBatchEngine()
+                except OSError as e:
+                    # e.g. blocked by a container seccomp profile or kernel.io_uring_disabled
+                    self.logger.warning(f"io_uring setup failed ({e}), using threads")
+            else:
+                self.logger.warning("io_uring requested but not available (needs Linux 5.1+ and liburing), using threads")
+        
+        async def read_file(file_path: str) -> bytes:
+            if uring is not None:
+                return await asyncio.wrap_future(uring.read(file_path))
+            return await loop.run_in_executor(None, Path(file_path).read_bytes)
+        
+        async def upload(index: int):
+            file_type, file_path = files_to_upload[index]
+            async with semaphore:
+                try:
+                    data = await read_file(file_path)
+                    upload_config = types.UploadFileConfig(
+                        mime_type=self._UPLOAD_MIME_TYPES[file_type],
+                        display_name=os.path.basename(file_path)
+                    )
+                    # Transient 503s are retried per file with a short jittered backoff,
+                    # the semaphore slot stays taken meanwhile so retries do not pile up
+                    uploaded_file = await self._retry_with_exponential_backoff_async(
+                        lambda: client.aio.files.upload(file=io.BytesIO(data), config=upload_config),
+                        base_delay=self._UPLOAD_RETRY_BASE_DELAY
+                    )
+                    return index, uploaded_file, None
+                except Exception as e:
+                    return index, None, e
+        
+        # Audio and note are started ahead of the frames
+        order = sorted(range(len(files_to_upload)), key=lambda index: files_to_upload[index][0] == 'frame')
+        tasks = [asyncio.ensure_future(upload(index)) for index in order]
+        results = [None] * len(files_to_upload)
+        
+        try:
+            for completed, next_upload in enumerate(asyncio.as_completed(tasks), 1):
+                index, uploaded_file, error = await next_upload
+                file_type, file_path = files_to_upload[index]
+                on_progress(completed, file_type)
+                if error is not None:
+                    self.logger.error(f"Failed to upload {os.path.basename(file_path)}: {error}")
+                    if file_type == 'audio':
+                        raise error
+                    # Continue with other files for non-critical uploads
+                    continue
+                
+                results[index] = uploaded_file
+        finally:
+            for task in tasks:
+                task.cancel()
+            if uring is not None:
+                uring.close()
+        
+        return results
+    
+    def _get_media_duration(self, path: str) -> float:
+        """
+        Get the duration of a media file in seconds.
+        
+        The container header is read in-process with PyAV when it is installed,
+        otherwise ffprobe is used.
+        """
+        try:
+            import av
+        except ImportError:
+            av = None
+        
+        if av is not None:
+            with av.open(path) as container:
+                if container.duration is not None:
+                    return container.duration / av.time_base
+        
+        result = subprocess.run([
+            self.config.ffprobe_path,
+            '-v', 'quiet',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            path
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+        return float(result.stdout.strip())
+    
+    def _count_prompt_tokens(self, client, prompt_text: str) -> int:
+        """
+        Count the tokens of a prompt, cached on disk by model and prompt hash.
+        
+        Prompt templates rarely change, so most runs skip the count_tokens request.
+        
+        Args:
+            client: Google GenAI client
+            prompt_text: Prompt to count
+        
+        Returns:
+            Number of prompt tokens
+        """
+        prompt_hash = hashlib.sha256(prompt_text.encode('utf-8')).hexdigest()
+        cache_key = f"{self.config.gemini_model}:{prompt_hash}"
+        
+        token_counts = _read_cache_file("tokens.json")
+        if cache_key in token_counts:
+            return token_counts[cache_key]
+        
+        prompt_tokens = client.models.count_tokens(
+            model=self.config.gemini_model,
+            contents=prompt_text
+        ).total_tokens
+        
+        token_counts[cache_key] = prompt_tokens
+        _write_cache_file("tokens.json", token_counts)
+        return prompt_tokens
+    
     def _cleanup(self):
         """Clean up temporary files."""
         self.logger.info("Cleaning up temporary files...")
         
         if not self.config.dry_run:
-            # Remove frames directory
-            if self.frames_dir.exists():
-                shutil.rmtree(self.frames_dir)
-                self.logger.info("Removed frames directory")
+            # Remove frames directory; the JPEG files are unlinked concurrently. A failure
+            # here must not fail the run, as that would delete the finished meeting.md.
+            if os.path.isdir(self.frames_dir):
+                try:
+                    frame_paths = []
+                    with os.scandir(self.frames_dir) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                _fast_rmtree(entry.path)
+                            else:
+                                frame_paths.append(entry.path)
+                    with ThreadPoolExecutor(max_workers=32) as executor:
+                        list(executor.map(os.unlink, frame_paths))
+                    os.rmdir(self.frames_dir)
+                    self.logger.info("Removed frames directory")
+                except Exception as e:
+                    self.logger.warning(f"Failed to remove frames directory: {e}")
             
             # Remove original video file after successful processing
             original_video_path = Path(self.video_path)
@@ -945,10 +2187,10 @@ class MeetingProcessor:
 def load_config() -> Config:
     """Load configuration from environment variables."""
     # Load environment variables from .env file
-    load_dotenv()
+    _load_env_file()
     
     # Create config with environment variables and defaults
-    config = Config()
+    config = Config.from_env()
     
     return config
 
@@ -956,20 +2198,116 @@ def load_config() -> Config:
 
 
 
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".mov", ".m4v", ".webm", ".avi")
+
+
+def _process_video_worker(config: Config, video_path: str, prompt_type: Optional[str],
+                          notes: Optional[str]) -> Dict[str, Any]:
+    """Process a single video inside a batch worker process and return its run stats."""
+    # Every job gets a directory of its own, even for equal timestamps or video names,
+    # and runs non-interactively: parallel workers cannot share the terminal
+    config = replace(config, exclusive_target_dir=True, interactive=False)
+    if config.target_directory:
+        # Keep batch outputs apart when a common target directory is given
+        config = replace(config, target_directory=str(Path(config.target_directory) / Path(video_path).stem))
+    
+    start_time = time.monotonic()
+    try:
+        MeetingProcessor(config).run(video_path, prompt_type, notes)
+        status = "completed"
+    except Exception as e:
+        status = f"failed ({e})"
+    
+    return {"video": video_path, "status": status, "seconds": time.monotonic() - start_time}
+
+
+def run_batch(video_paths: List[str], config: Config, max_workers: Optional[int] = None,
+              prompt_type: Optional[str] = None, notes: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Process several videos concurrently, one MeetingProcessor per worker process.
+    
+    Args:
+        video_paths: Video files to process
+        config: Configuration shared by all workers
+        max_workers: Maximum number of parallel workers (defaults to CPU count)
+        prompt_type: Prompt template used for every video
+        notes: Notes used for every video (batch mode never prompts for notes)
+    
+    Returns:
+        Run stats (video, status, seconds) per video in input order
+    """
+    processor = MeetingProcessor(config)
+    logger = processor.logger
+    
+    worker_limit = os.cpu_count() or 1
+    if not config.use_handbrake and config.nvenc_usable:
+        # Each worker holds one NVENC session, consumer GPUs only allow a few
+        worker_limit = min(worker_limit, config.nvenc_max_sessions)
+    max_workers = min(max_workers or worker_limit, worker_limit, len(video_paths))
+    
+    logger.info(f"Starting batch processing of {len(video_paths)} videos with {max_workers} workers")
+    
+    start_time = time.monotonic()
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_process_video_worker, config, video_path, prompt_type,
+                            notes if notes is not None else ""): video_path
+            for video_path in video_paths
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            logger.info(f"Finished {result['video']}: {result['status']} in {result['seconds']:.1f}s")
+    
+    wall_seconds = time.monotonic() - start_time
+    run_stats = [results[video_path] for video_path in video_paths]
+    
+    logger.info("Batch run stats:")
+    for stats in run_stats:
+        logger.info(f"  • {Path(stats['video']).name}: {stats['status']} ({stats['seconds']:.1f}s)")
+    
+    total_seconds = sum(stats["seconds"] for stats in run_stats)
+    logger.info(f"  • wall time: {wall_seconds:.1f}s, sum of per-video times: {total_seconds:.1f}s")
+    
+    return run_stats
+
+
+def _collect_video_paths(paths: List[str]) -> List[str]:
+    """Expand directories into the video files they contain."""
+    video_paths = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            video_paths.extend(
+                str(p) for p in sorted(path.iterdir())
+                if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS
+            )
+        else:
+            video_paths.append(str(path))
+    return video_paths
+
+
 def setup_dependencies():
     """Install Python dependencies."""
     print("Installing Python dependencies...")
     
     requirements = [
         "requests",
-        "questionary", 
+        "questionary",
         "ffmpeg-python",
         "google-genai",
-        "python-dotenv>=1.0.0"
+        "python-dotenv>=1.0.0",
+        "orjson",
+        "msgspec",
+        "tqdm"
     ]
     
-    for req in requirements:
-        subprocess.run([sys.executable, "-m", "pip", "install", req])
+    # One pip run resolves all requirements together
+    result = subprocess.run([sys.executable, "-m", "pip", "install",
+                             "--disable-pip-version-check", "--no-input", *requirements])
+    if result.returncode != 0:
+        print("Dependencies installation failed!")
+        sys.exit(result.returncode)
     
     print("Dependencies installation completed!")
 
@@ -978,6 +2316,9 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Meeting Video Processor and Documentation Tool")
     parser.add_argument("--video", help="Path to video file")
+    parser.add_argument("--batch", nargs="+", metavar="PATH",
+                       help="Process several video files (or directories of videos) in parallel")
+    parser.add_argument("--max-workers", type=int, help="Maximum number of parallel workers in batch mode")
     parser.add_argument("--prompt", 
                        help="Prompt template to use. Options: prompt.txt, prompt_wo_transcript.txt, prompt_only_transcript.txt, 'only transcript', 'without transcript'")
     parser.add_argument("--notes", help="Notes content (alternative to interactive input)")
@@ -994,7 +2335,7 @@ def main():
         return
     
     # Check if required dependencies are available
-    if questionary is None or requests is None:
+    if importlib.util.find_spec("questionary") is None:
         print("Error: Required dependencies not found!")
         print("Please run: python3 meeting_processor.py --setup")
         print("Or use the wrapper script: ./meeting.sh --setup")
@@ -1007,10 +2348,22 @@ def main():
     config.no_cleanup = args.no_cleanup
     config.target_directory = args.directory
     
+    if args.batch:
+        video_paths = _collect_video_paths(args.batch)
+        missing = [video_path for video_path in video_paths if not Path(video_path).exists()]
+        if not video_paths or missing:
+            print(f"Error: Video file not found! {', '.join(missing)}")
+            return 1
+        
+        run_stats = run_batch(video_paths, config, args.max_workers, args.prompt, args.notes)
+        return 0 if all(stats["status"] == "completed" for stats in run_stats) else 1
+    
     # Get video path
     if args.video:
         video_path = args.video
     else:
+        import questionary
+        
         video_path = questionary.path("Enter path to video file:").ask()
     
     if not video_path or not Path(video_path).exists():
@@ -0,0 +1,71 @@
+"""Tests for the io_uring batch reader (Linux with liburing only)."""
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_processor import IoUringBatchEngine, _io_uring_available
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux") or not _io_uring_available(),
+    reason="io_uring needs Linux 5.1+ and liburing",
+)
+
+
+@pytest.fixture
+def engine():
+    engine = IoUringBatchEngine(entries=4)
+    yield engine
+    engine.close()
+
+
+def test_reads_files_larger_than_one_batch(engine, tmp_path):
+    contents = {}
+    for i in range(10):
+        path = tmp_path / f"frame_{i:04d}.jpg"
+        data = os.urandom(1000 * (i + 1))
+        path.write_bytes(data)
+        contents[str(path)] = data
+    (tmp_path / "empty.txt").write_bytes(b"")
+    contents[str(tmp_path / "empty.txt")] = b""
+    
+    futures = {path: engine.read(path) for path in contents}
+    for path, future in futures.items():
+        assert future.result(timeout=10) == contents[path]
+
+
+def test_read_errors_only_fail_their_request(engine, tmp_path):
+    good = tmp_path / "note.txt"
+    good.write_bytes(b"note")
+    
+    missing = engine.read(str(tmp_path / "missing.txt"))
+    directory = engine.read(str(tmp_path))
+    ok = engine.read(str(good))
+    
+    with pytest.raises(OSError):
+        missing.result(timeout=10)
+    with pytest.raises(OSError):
+        directory.result(timeout=10)
+    assert ok.result(timeout=10) == b"note"
+
+
+def test_ring_failure_fails_pending_and_later_reads(tmp_path):
+    path = tmp_path / "frame_0001.jpg"
+    path.write_bytes(b"frame")
+    
+    engine = IoUringBatchEngine()
+    try:
+        with mock.patch.object(engine._liburing, "io_uring_submit", side_effect=OSError("ring broken")):
+            with pytest.raises(RuntimeError):
+                engine.read(str(path)).result(timeout=10)
+        engine._thread.join(timeout=10)
+        assert not engine._thread.is_alive()
+        
+        with pytest.raises(RuntimeError):
+            engine.read(str(path)).result(timeout=10)
+    finally:
+        engine.close()
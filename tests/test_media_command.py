@@ -0,0 +1,55 @@
+"""Tests for mapping the HandBrake preset onto ffmpeg encoder arguments."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import meeting_processor
+from meeting_processor import Config, MeetingProcessor
+
+
+@pytest.fixture
+def processor():
+    return MeetingProcessor(Config())
+
+
+@pytest.fixture
+def preset(processor):
+    return dict(processor._load_handbrake_preset(), VideoEncoder="vt_h265",
+                VideoQualityType=2, VideoQualitySlider=15, VideoAvgBitrate=4000)
+
+
+def test_videotoolbox_constant_quality_on_macos(processor, preset, monkeypatch):
+    monkeypatch.setattr(meeting_processor.platform, "system", lambda: "Darwin")
+
+    args = processor._video_encoder_args(preset, use_nvenc=False)
+
+    assert args[args.index("-c:v"):] == ["-c:v", "hevc_videotoolbox", "-q:v", "15", "-tag:v", "hvc1"]
+
+
+def test_videotoolbox_falls_back_to_libx264_bitrate(processor, preset, monkeypatch):
+    monkeypatch.setattr(meeting_processor.platform, "system", lambda: "Linux")
+    linux_args = processor._video_encoder_args(preset, use_nvenc=False)
+    monkeypatch.setattr(meeting_processor.platform, "system", lambda: "Darwin")
+    software_args = processor._video_encoder_args(preset, use_nvenc=False, software_only=True)
+
+    expected = ["-c:v", "libx264", "-preset", "veryfast", "-b:v", "4000k"]
+    assert linux_args[linux_args.index("-c:v"):] == expected
+    assert software_args[software_args.index("-c:v"):] == expected
+
+
+def test_x264_rf_maps_to_crf(processor, preset):
+    args = processor._video_encoder_args(dict(preset, VideoEncoder="x264", VideoQualitySlider=22), use_nvenc=False)
+
+    assert args[args.index("-c:v"):] == ["-c:v", "libx264", "-preset", "veryfast", "-crf", "22"]
+
+
+@pytest.mark.parametrize("framerate, expected", [("10", "10"), ("auto", None), (None, None)])
+def test_framerate_only_for_numeric_values(processor, preset, framerate, expected):
+    args = processor._video_encoder_args(dict(preset, VideoFramerate=framerate), use_nvenc=False)
+
+    rate = args[args.index("-r") + 1] if "-r" in args else None
+    assert rate == expected
@@ -0,0 +1,42 @@
+"""Tests for loading model_limits.json with msgspec validation."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("msgspec")
+
+from meeting_processor import Config, _decode_model_limits
+
+
+def test_invalid_fields_fall_back_to_their_defaults():
+    limits = _decode_model_limits(b'''{
+        "gemini-2.5-pro": {
+            "max_input_tokens": "x",
+            "max_images_per_prompt": -1,
+            "max_output_tokens": 8192,
+            "parameter_defaults": {"temperature": 0.5, "top_p": "high"}
+        },
+        "gemini-2.5-flash": 3
+    }''')
+
+    pro = limits["gemini-2.5-pro"]
+    assert pro["max_input_tokens"] == 1048576
+    assert pro["max_images_per_prompt"] == 3000
+    assert pro["max_output_tokens"] == 8192
+    assert pro["parameter_defaults"] == {"temperature": 0.5, "top_p": 0.95, "top_k": 64, "candidate_count": 1}
+    assert limits["gemini-2.5-flash"]["max_output_tokens"] == 65535
+
+
+def test_out_of_range_parameter_defaults_are_clamped():
+    config = Config()
+    config.model_limits = _decode_model_limits(
+        b'{"gemini-2.5-pro": {"parameter_defaults": {"temperature": 5, "candidate_count": 20}}}'
+    )
+
+    assert config._validate_parameter_defaults("gemini-2.5-pro") == {
+        "temperature": 2.0, "top_p": 0.95, "top_k": 64, "candidate_count": 8
+    }
@@ -0,0 +1,222 @@
+"""Tests for the Gemini upload step, run against a stubbed google.genai SDK."""
+
+import itertools
+import os
+import sys
+import types
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import meeting_processor
+from meeting_processor import Config, MeetingProcessor, _base64_size
+
+
+class FakeFile:
+    """Uploaded file handle as returned by client.files.upload."""
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+
+class FakePart:
+    """Inline content part as built by types.Part.from_bytes."""
+
+    def __init__(self, data, mime_type):
+        self.data = data
+        self.mime_type = mime_type
+
+    @classmethod
+    def from_bytes(cls, data=None, mime_type=None):
+        return cls(data, mime_type)
+
+
+class FakeConfig:
+    """Stand-in for the SDK's keyword-only config types."""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeClient:
+    """Records uploads, generate_content calls and deletes."""
+
+    def __init__(self, api_key=None, http_options=None):
+        self.uploads = []
+        self.deleted = []
+        self.contents = None
+        self._names = itertools.count()
+
+        client = self
+
+        class AioFiles:
+            async def upload(self, file=None, config=None):
+                uploaded_file = FakeFile(f"files/{next(client._names)}", file.read())
+                client.uploads.append(uploaded_file)
+                return uploaded_file
+
+        class Files:
+            def delete(self, name=None):
+                client.deleted.append(name)
+
+        class Models:
+            def count_tokens(self, model=None, contents=None):
+                return types.SimpleNamespace(total_tokens=1)
+
+            def generate_content(self, model=None, contents=None, config=None):
+                client.contents = contents
+                return types.SimpleNamespace(text="# Meeting")
+
+        self.aio = types.SimpleNamespace(files=AioFiles())
+        self.files = Files()
+        self.models = Models()
+
+
+@pytest.fixture
+def genai_stub(monkeypatch):
+    """Install a minimal google.genai package in place of the real SDK."""
+    genai_types = types.ModuleType("google.genai.types")
+    genai_types.Part = FakePart
+    genai_types.UploadFileConfig = FakeConfig
+    genai_types.GenerateContentConfig = FakeConfig
+    genai_types.HttpOptions = FakeConfig
+
+    genai = types.ModuleType("google.genai")
+    genai.Client = FakeClient
+    genai.types = genai_types
+
+    google = types.ModuleType("google")
+    google.genai = genai
+
+    monkeypatch.setitem(sys.modules, "google", google)
+    monkeypatch.setitem(sys.modules, "google.genai", genai)
+    monkeypatch.setitem(sys.modules, "google.genai.types", genai_types)
+    meeting_processor._import_genai.cache_clear()
+    yield
+    meeting_processor._import_genai.cache_clear()
+
+
+@pytest.fixture
+def processor(genai_stub, tmp_path, monkeypatch):
+    """Processor with a target directory holding prompt.txt and an empty frames directory."""
+    monkeypatch.setattr(meeting_processor, "_CACHE_DIR", tmp_path / "cache")
+
+    config = Config()
+    config.gemini_api_key = "test-key"
+    config.target_directory = str(tmp_path / "meeting")
+
+    processor = MeetingProcessor(config)
+    processor._create_target_directory(datetime(2025, 7, 20, 14, 12))
+    os.makedirs(processor.frames_dir)
+    with open(processor.prompt_path, 'wb') as f:
+        f.write(b"P")
+    return processor
+
+
+def write_frames(processor, contents):
+    for index, data in enumerate(contents, 1):
+        with open(os.path.join(processor.frames_dir, f"frame_{index:04d}.jpg"), 'wb') as f:
+            f.write(data)
+
+
+def set_inline_budget(monkeypatch, budget, headroom=200):
+    """Leave `budget` bytes for inline parts after the 1-byte prompt and the headroom."""
+    monkeypatch.setattr(MeetingProcessor, "_INLINE_HEADROOM", headroom)
+    monkeypatch.setattr(MeetingProcessor, "_INLINE_BYTES_LIMIT", 1 + headroom + budget)
+
+
+def frame_parts(client):
+    """Inline parts and uploaded files of the request, in request order, without the prompt."""
+    return [part for part in client.contents[1:] if getattr(part, "mime_type", None) != "text/plain"]
+
+
+def test_frame_order_kept_across_inline_and_uploaded_parts(processor, monkeypatch):
+    frames = [b"frame%d" % index + bytes(100) for index in range(1, 7)]
+    write_frames(processor, frames)
+    set_inline_budget(monkeypatch, 2 * _base64_size(len(frames[0])))
+
+    processor._upload_to_gemini()
+    client = processor._gemini_client
+
+    parts = frame_parts(client)
+    assert [type(part) for part in parts] == [FakePart] * 2 + [FakeFile] * 4
+    assert [part.data for part in parts] == frames
+
+
+def test_duplicate_frames_reuse_one_upload(processor, monkeypatch):
+    slide, speaker = b"slide" + bytes(100), b"speaker" + bytes(100)
+    write_frames(processor, [slide, slide, speaker, slide, speaker, speaker])
+    set_inline_budget(monkeypatch, 0)
+
+    processor._upload_to_gemini()
+    client = processor._gemini_client
+
+    assert sorted(uploaded_file.data for uploaded_file in client.uploads) == [slide, speaker]
+    parts = frame_parts(client)
+    assert [part.data for part in parts] == [slide, slide, speaker, slide, speaker, speaker]
+    assert parts[0] is parts[1] is parts[3]
+    assert parts[2] is parts[4] is parts[5]
+
+
+def test_each_upload_deleted_exactly_once(processor, monkeypatch):
+    slide = b"slide" + bytes(100)
+    write_frames(processor, [b"intro" + bytes(100), slide, slide, b"outro" + bytes(100)])
+    with open(processor.note_path, 'wb') as f:
+        f.write(b"notes" * 100)
+    set_inline_budget(monkeypatch, 0)
+
+    processor._upload_to_gemini()
+    client = processor._gemini_client
+
+    assert len(client.uploads) == 4  # three unique frames and note.txt
+    assert sorted(client.deleted) == sorted(uploaded_file.name for uploaded_file in client.uploads)
+
+
+def test_inline_budget_charges_base64_size_and_headroom(processor, monkeypatch):
+    frames = [b"frame%d" % index + bytes(100) for index in range(1, 5)]
+    write_frames(processor, frames)
+    # Raw sizes of three frames fit, their base64 encoding only for two
+    budget = 3 * len(frames[0])
+    assert 2 * _base64_size(len(frames[0])) <= budget < 3 * _base64_size(len(frames[0]))
+    set_inline_budget(monkeypatch, budget)
+
+    processor._upload_to_gemini()
+    client = processor._gemini_client
+
+    parts = frame_parts(client)
+    assert [type(part) for part in parts] == [FakePart] * 2 + [FakeFile] * 2
+    assert [part.data for part in parts] == frames
+
+
+def test_inline_note_charged_at_base64_size(processor, monkeypatch):
+    note = b"n" * 300
+    with open(processor.note_path, 'wb') as f:
+        f.write(note)
+    set_inline_budget(monkeypatch, len(note))
+
+    processor._upload_to_gemini()
+    client = processor._gemini_client
+
+    assert [uploaded_file.data for uploaded_file in client.uploads] == [note]
+    assert client.contents[1:] == client.uploads
+
+
+def test_io_uring_setup_failure_falls_back_to_threads(processor, monkeypatch):
+    frames = [b"frame%d" % index + bytes(100) for index in range(1, 3)]
+    write_frames(processor, frames)
+    set_inline_budget(monkeypatch, 0)
+
+    def blocked_ring(*args, **kwargs):
+        raise PermissionError(1, "Operation not permitted")
+
+    processor.config.use_uring = True
+    monkeypatch.setattr(meeting_processor, "_io_uring_available", lambda: True)
+    monkeypatch.setattr(meeting_processor, "IoUringBatchEngine", blocked_ring)
+
+    processor._upload_to_gemini()
+    client = processor._gemini_client
+
+    assert [part.data for part in frame_parts(client)] == frames